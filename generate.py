@@ -158,10 +158,10 @@ def main(
             valid_rooms, batch_summary = validator.validate_batch(parsed_rooms, config_dict)
             
             # Write error reports
-            for room_data in parsed_rooms:
-                validation_result = validator.validate_room_data(room_data, config_dict)
-                if not validation_result.is_valid or validation_result.warnings:
-                    error_reporter.write_room_errors(room_data.room_id, validation_result)
+            error_reporter.write_room_errors_batch(
+                (room_data.room_id, validator.validate_room_data(room_data, config_dict))
+                for room_data in parsed_rooms
+            )
             
             error_reporter.write_batch_summary(batch_summary, str(input), str(config))
             
@@ -288,23 +288,15 @@ def main(
                 generated_pdfs = []
                 pdf_errors = 0
                 
-                for layout in computed_layouts:
-                    try:
-                        if verbose:
-                            click.echo(f"  Generating PDF for {layout.room_id}...")
-                        
-                        pdf_path = drawing_generator.generate_shop_drawing(layout, output)
-                        generated_pdfs.append(pdf_path)
-                        
-                        if verbose:
-                            click.echo(f"    ✓ PDF generated: {pdf_path}")
-                    
-                    except Exception as e:
+                for room_id, pdf_path, error in drawing_generator.generate_batch(computed_layouts, output):
+                    if error is not None:
                         pdf_errors += 1
-                        click.echo(f"Error generating PDF for {layout.room_id}: {e}", err=True)
-                        if verbose:
-                            import traceback
-                            traceback.print_exc()
+                        click.echo(f"Error generating PDF for {room_id}: {error}", err=True)
+                        continue
+                    
+                    generated_pdfs.append(pdf_path)
+                    if verbose:
+                        click.echo(f"  ✓ PDF generated for {room_id}: {pdf_path}")
                 
                 # Report PDF generation results
                 successful_pdfs = len(generated_pdfs)
@@ -299,19 +299,9 @@ class ConfigLoader(IConfigLoader):
     
     def get_config_hash(self, config: Dict[str, Any]) -> str:
         """Generate SHA256 hash of configuration for reproducibility."""
-        # Sort keys recursively for consistent hashing
-        sorted_config = self._sort_dict_recursively(config)
-        config_json = json.dumps(sorted_config, sort_keys=True, separators=(',', ':'))
+        # sort_keys orders nested dictionaries too, giving a canonical encoding
+        config_json = json.dumps(config, sort_keys=True, separators=(',', ':'))
         return hashlib.sha256(config_json.encode('utf-8')).hexdigest()
-    
-    def _sort_dict_recursively(self, obj: Any) -> Any:
-        """Recursively sort dictionary keys for consistent hashing."""
-        if isinstance(obj, dict):
-            return {k: self._sort_dict_recursively(v) for k, v in sorted(obj.items())}
-        elif isinstance(obj, list):
-            return [self._sort_dict_recursively(item) for item in obj]
-        else:
-            return obj
 
 
 def load_default_config() -> MillworkConfig:
@@ -6,7 +6,7 @@ components, enabling the DXF-ready architecture through the adapter pattern.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type, TYPE_CHECKING
 from dataclasses import dataclass
 from enum import Enum
 
@@ -29,20 +29,31 @@ class RenderStyle(Enum):
     HATCH_INSULATION = "hatch_insulation"
 
 
-@dataclass
+@dataclass(frozen=True)
 class Point:
     """2D point in drawing coordinates."""
+    # Immutable and hashable; manual __slots__ (dataclass(slots=True) needs
+    # Python 3.10) drops the per-instance __dict__
+    __slots__ = ('x', 'y')
     x: float
     y: float
+    
+    def __reduce__(self) -> Tuple[Type["Point"], Tuple[float, float]]:
+        # Frozen slots can't be restored by pickle's default setattr path
+        return (Point, (self.x, self.y))
 
 
-@dataclass
+@dataclass(frozen=True)
 class Rectangle:
     """Rectangle defined by origin point and dimensions."""
+    __slots__ = ('x', 'y', 'width', 'height')
     x: float
     y: float
     width: float
     height: float
+    
+    def __reduce__(self) -> Tuple[Type["Rectangle"], Tuple[float, float, float, float]]:
+        return (Rectangle, (self.x, self.y, self.width, self.height))
 
 
 @dataclass
@@ -90,6 +101,13 @@ class IRenderer(ABC):
         """Draw text at specified location with style and rotation."""
         pass
     
+    def draw_texts(self, texts: List[Tuple[float, float, str]],
+                   style: RenderStyle = RenderStyle.TEXT_MEDIUM,
+                   rotation: float = 0.0) -> None:
+        """Draw several (x, y, text) labels sharing one style and rotation."""
+        for x, y, text in texts:
+            self.draw_text(x, y, text, style, rotation)
+    
     @abstractmethod
     def draw_dimension(self, x1: float, x2: float, y_base: float, 
                       dimension_text: str,
@@ -139,6 +157,13 @@ class ValidationResult:
         self.errors.append(ValidationError(field, message, value, row_id, row_number, "error"))
         self.is_valid = False
     
+    def add_errors(self, errors: Iterable[ValidationError]) -> None:
+        """Add several existing validation errors in one call."""
+        error_count = len(self.errors)
+        self.errors.extend(errors)
+        if len(self.errors) != error_count:
+            self.is_valid = False
+    
     def add_warning(self, field: str, message: str, value: Any,
                    row_id: Optional[str] = None, row_number: Optional[int] = None) -> None:
         """Add a validation warning."""
@@ -182,6 +207,7 @@ class IValidator(ABC):
 @dataclass
 class LayoutElement:
     """Base class for layout elements."""
+    __slots__ = ('element_type', 'bounds', 'style', 'metadata')
     element_type: str
     bounds: Rectangle
     style: RenderStyle
@@ -191,6 +217,7 @@ class LayoutElement:
 @dataclass
 class ModuleElement(LayoutElement):
     """Represents a cabinet module in the layout."""
+    __slots__ = ('width', 'depth', 'material_code')
     width: float
     depth: float
     material_code: str
@@ -206,6 +233,7 @@ class ModuleElement(LayoutElement):
 @dataclass
 class FillerElement(LayoutElement):
     """Represents a filler strip in the layout."""
+    __slots__ = ('width', 'position')
     width: float
     position: str  # "left" or "right"
     
@@ -219,6 +247,7 @@ class FillerElement(LayoutElement):
 @dataclass
 class CountertopElement(LayoutElement):
     """Represents the countertop in the layout."""
+    __slots__ = ('material_code', 'thickness', 'overhang')
     material_code: str
     thickness: float
     overhang: float
@@ -234,6 +263,7 @@ class CountertopElement(LayoutElement):
 @dataclass
 class ADAElement(LayoutElement):
     """Represents ADA compliance visualization."""
+    __slots__ = ('knee_clear', 'toe_clear', 'counter_range', 'code_basis')
     knee_clear: str
     toe_clear: str
     counter_range: str
@@ -251,6 +281,7 @@ class ADAElement(LayoutElement):
 @dataclass
 class ModuleLayout:
     """Geometric layout of a single cabinet module."""
+    __slots__ = ('index', 'x', 'y', 'width', 'height', 'depth', 'material_code')
     index: int              # Module number (0-based)
     x: float               # Left edge x-coordinate (inches)
     y: float               # Bottom edge y-coordinate (inches)
@@ -263,6 +294,7 @@ class ModuleLayout:
 @dataclass
 class FillerLayout:
     """Geometric layout of a filler strip."""
+    __slots__ = ('side', 'x', 'y', 'width', 'height', 'depth')
     side: str              # "left" or "right"
     x: float               # Left edge x-coordinate (inches)
     y: float               # Bottom edge y-coordinate (inches)
@@ -274,6 +306,7 @@ class FillerLayout:
 @dataclass
 class CountertopLayout:
     """Geometric layout of countertop surface."""
+    __slots__ = ('x', 'y', 'width', 'depth', 'height', 'material_code')
     x: float               # Left edge x-coordinate (inches)
     y: float               # Bottom edge y-coordinate (inches)
     width: float           # Total countertop width (inches)
@@ -6,10 +6,30 @@ management, and tolerance handling for the millwork layout engine.
 """
 
 import math
+import re
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Tuple
 from ..core.interfaces import Rectangle, Point
 
 
+# A number with an optional inch mark followed by its axis, e.g. 27" H
+_CLEARANCE_PATTERN = re.compile(r'(\d+(?:\.\d+)?)"?\s*([HWD])', re.IGNORECASE)
+_CLEARANCE_AXES = {"H": "height", "W": "width", "D": "depth"}
+
+
+@lru_cache(maxsize=32)
+def _parse_clearance_dimensions(clearance_str: str) -> Tuple[Tuple[str, float], ...]:
+    """Scan a clearance string once, keeping the first value given for each axis."""
+    dimensions = {"height": 0, "width": 0, "depth": 0}
+    seen = set()
+    for value, axis in _CLEARANCE_PATTERN.findall(clearance_str):
+        name = _CLEARANCE_AXES[axis.upper()]
+        if name not in seen:
+            seen.add(name)
+            dimensions[name] = float(value)
+    return tuple(dimensions.items())
+
+
 class GeometryUtils:
     """Utility functions for geometric calculations and coordinate transforms."""
     
@@ -86,10 +106,21 @@ class GeometryUtils:
         if not rectangles:
             return Rectangle(0, 0, 0, 0)
         
-        min_x = min(rect.x for rect in rectangles)
-        min_y = min(rect.y for rect in rectangles)
-        max_x = max(rect.x + rect.width for rect in rectangles)
-        max_y = max(rect.y + rect.height for rect in rectangles)
+        # One pass over the rectangles rather than four generator scans
+        first = rectangles[0]
+        min_x, min_y = first.x, first.y
+        max_x, max_y = first.x + first.width, first.y + first.height
+        for rect in rectangles:
+            if rect.x < min_x:
+                min_x = rect.x
+            if rect.y < min_y:
+                min_y = rect.y
+            right = rect.x + rect.width
+            if right > max_x:
+                max_x = right
+            top = rect.y + rect.height
+            if top > max_y:
+                max_y = top
         
         return Rectangle(
             x=min_x,
@@ -119,7 +150,8 @@ class GeometryUtils:
         if tolerance is None:
             tolerance = self.config.get("TOLERANCES", {}).get("LENGTH_SUM", 0.125)
         
-        computed_sum = sum(module_widths) + left_filler + right_filler
+        # fsum matches the parser-side check in validator.py, so both agree at the tolerance edge
+        computed_sum = math.fsum(module_widths) + left_filler + right_filler
         difference = abs(computed_sum - total_length)
         
         is_valid = difference <= tolerance
@@ -216,24 +248,9 @@ class GeometryUtils:
         Returns:
             Dictionary with height, width, depth dimensions
         """
-        dimensions = {"height": 0, "width": 0, "depth": 0}
-        
-        # Extract numbers followed by dimension indicators
-        import re
-        
-        # Match patterns like "27\" H", "30\" W", "17\" D"
-        height_match = re.search(r'(\d+(?:\.\d+)?)"?\s*H', clearance_str, re.IGNORECASE)
-        width_match = re.search(r'(\d+(?:\.\d+)?)"?\s*W', clearance_str, re.IGNORECASE)
-        depth_match = re.search(r'(\d+(?:\.\d+)?)"?\s*D', clearance_str, re.IGNORECASE)
-        
-        if height_match:
-            dimensions["height"] = float(height_match.group(1))
-        if width_match:
-            dimensions["width"] = float(width_match.group(1))
-        if depth_match:
-            dimensions["depth"] = float(depth_match.group(1))
-            
-        return dimensions
+        # Config strings repeat for every room, so parses are cached; each
+        # caller still gets its own dict
+        return dict(_parse_clearance_dimensions(clearance_str))
     
     def create_ada_boxes(self, countertop_rect: Rectangle, counter_height: float) -> Tuple[Rectangle, Rectangle]:
         """
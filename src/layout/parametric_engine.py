@@ -5,7 +5,11 @@ Implements the ILayoutEngine interface to transform validated room data
 into precise geometric layouts ready for rendering.
 """
 
+import copy
+import hashlib
+import json
 import time
+from itertools import accumulate
 from typing import Dict, Any, List, Optional
 from ..core.interfaces import (
     ILayoutEngine, LayoutResult, ModuleLayout, FillerLayout, 
@@ -33,6 +37,9 @@ class ParametricLayoutEngine(ILayoutEngine):
         """
         self.config = config
         self.geometry_utils = GeometryUtils(config)
+        # Copy of the last config hashed and its digest; batches pass the same config for every room
+        self._hashed_config: Optional[Dict[str, Any]] = None
+        self._config_hash = ""
         
     def compute_layout(self, room_data: ParsedRoomData, 
                       config: Dict[str, Any]) -> LayoutResult:
@@ -46,7 +53,8 @@ class ParametricLayoutEngine(ILayoutEngine):
         Returns:
             LayoutResult with complete geometric layout
         """
-        start_time = time.time()
+        # Monotonic, nanosecond-resolution clock: sub-millisecond layouts still time above zero
+        start_ns = time.perf_counter_ns()
         
         # Use the provided config for this computation
         self.config = config
@@ -72,13 +80,12 @@ class ParametricLayoutEngine(ILayoutEngine):
             total_width, total_depth, bounding_box = self._calculate_bounds(modules, fillers, countertop)
             
             # 6. Validate geometric consistency
-            layout_validation = self._validate_layout_geometry(
-                modules, fillers, room_data, total_width
+            self._validate_layout_geometry(
+                modules, fillers, room_data, total_width, validation_result
             )
-            validation_result.merge(layout_validation)
             
             # 7. Create metadata
-            computation_time = (time.time() - start_time) * 1000  # Convert to milliseconds
+            computation_time = (time.perf_counter_ns() - start_ns) / 1_000_000  # Convert to milliseconds
             metadata = LayoutMetadata(
                 room_id=room_data.room_id,
                 timestamp=time.strftime("%Y-%m-%d %H:%M:%S"),
@@ -173,27 +180,21 @@ class ParametricLayoutEngine(ILayoutEngine):
         Returns:
             List of ModuleLayout objects with computed positions
         """
-        modules = []
-        current_x = room_data.left_filler_in  # Start after left filler
+        widths = room_data.module_widths
+        material_code = room_data.material_casework
         
         # Get dimensions from configuration
         module_height = self.config.get("COUNTER_HEIGHT", 36.0)
         module_depth = self.config.get("BASE_DEPTH", 24.0)
         
-        for i, width in enumerate(room_data.module_widths):
-            module = ModuleLayout(
-                index=i,
-                x=current_x,
-                y=0.0,  # Base level
-                width=width,
-                height=module_height,
-                depth=module_depth,
-                material_code=room_data.material_casework
-            )
-            modules.append(module)
-            current_x += width
-            
-        return modules
+        # Left edges are a running sum of widths starting after the left filler.
+        # Positional args (index, x, y, width, height, depth, material_code) skip
+        # keyword matching; y=0.0 is base level
+        left_edges = accumulate(widths, initial=room_data.left_filler_in)
+        return [
+            ModuleLayout(i, x, 0.0, width, module_height, module_depth, material_code)
+            for i, (x, width) in enumerate(zip(left_edges, widths))
+        ]
     
     def _compute_filler_positions(self, modules: List[ModuleLayout], 
                                  room_data: ParsedRoomData) -> List[FillerLayout]:
@@ -365,7 +366,8 @@ class ParametricLayoutEngine(ILayoutEngine):
     def _validate_layout_geometry(self, modules: List[ModuleLayout], 
                                  fillers: List[FillerLayout],
                                  room_data: ParsedRoomData,
-                                 computed_width: float) -> ValidationResult:
+                                 computed_width: float,
+                                 validation_result: ValidationResult) -> None:
         """
         Validate the computed layout geometry against input specifications.
         
@@ -374,12 +376,8 @@ class ParametricLayoutEngine(ILayoutEngine):
             fillers: List of filler layouts
             room_data: Original room data for comparison
             computed_width: Computed total width
-            
-        Returns:
-            ValidationResult with validation status
+            validation_result: Result that findings are added to in place
         """
-        validation_result = ValidationResult(is_valid=True, errors=[], warnings=[])
-        
         # Validate length sum against tolerance
         module_widths = [m.width for m in modules]
         filler_widths = room_data.left_filler_in + room_data.right_filler_in
@@ -415,8 +413,6 @@ class ParametricLayoutEngine(ILayoutEngine):
                     value=computed_width,
                     row_id=room_data.room_id
                 )
-        
-        return validation_result
     
     def _get_config_hash(self, config: Dict[str, Any]) -> str:
         """
@@ -428,9 +424,11 @@ class ParametricLayoutEngine(ILayoutEngine):
         Returns:
             SHA256 hash string
         """
-        import hashlib
-        import json
-        
-        # Create a sorted JSON representation for consistent hashing
-        config_str = json.dumps(config, sort_keys=True)
-        return hashlib.sha256(config_str.encode()).hexdigest()[:16]  # First 16 chars
\ No newline at end of file
+        # Compare contents against a private copy, so an in-place edit of the
+        # caller's dict is re-hashed rather than stamped with the old digest
+        if self._hashed_config is None or config != self._hashed_config:
+            # Create a sorted JSON representation for consistent hashing
+            config_str = json.dumps(config, sort_keys=True)
+            self._config_hash = hashlib.sha256(config_str.encode()).hexdigest()[:16]  # First 16 chars
+            self._hashed_config = copy.deepcopy(config)
+        return self._config_hash
\ No newline at end of file
@@ -6,14 +6,45 @@ defined in schema.py and validation rules from tech_specs.md section 4.
 """
 
 import csv
+import io
 import json
+import mmap
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Union, Tuple
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Set, Tuple, Union
 from dataclasses import dataclass
 
 from .schema import RoomSchema, FieldDefinition, FieldType, ParsedRoomData
-from ..core.interfaces import ValidationResult
+from ..core.interfaces import ValidationError, ValidationResult
+
+
+def _reject_json_constant(name: str) -> Any:
+    """Reject NaN/Infinity in JSON arrays, as strict JSON decoders do."""
+    raise json.JSONDecodeError(f"Invalid constant {name}", name, 0)
+
+
+_json_loads: Callable[[str], Any]  # Cells are always str; both decoders accept it
+try:
+    import orjson
+    _json_loads = orjson.loads  # orjson.JSONDecodeError subclasses json.JSONDecodeError
+except ImportError:  # Optional: falls back to the stdlib decoder
+    _json_decoder = json.JSONDecoder(parse_constant=_reject_json_constant)
+    _json_loads = _json_decoder.decode
+
+
+# Plain decimal or scientific notation. Checked before float()/int() so malformed
+# cells never raise; this also rejects inf/nan, which float() would accept.
+_NUMBER_PATTERN = re.compile(r'[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?')
+_INTEGER_PATTERN = re.compile(r'[+-]?\d+')
+
+# Accepted boolean spellings, matched after lower()/strip()
+_BOOLEAN_VALUES: Dict[str, bool] = {
+    **dict.fromkeys(('true', '1', 'yes', 'y'), True),
+    **dict.fromkeys(('false', '0', 'no', 'n'), False),
+}
 
 
 @dataclass
@@ -52,9 +83,9 @@ class FieldParser:
                 error_message=f"String too long: {len(value)} > {field_def.max_length}"
             )
         
-        # Check pattern constraint
-        if field_def.pattern is not None:
-            if not re.match(field_def.pattern, value):
+        # Check pattern constraint; fullmatch so a trailing newline can't satisfy '$'
+        if field_def._compiled_pattern is not None:
+            if not field_def._compiled_pattern.fullmatch(value):
                 return ParsedValue(
                     value=None,
                     is_valid=False,
@@ -62,105 +93,111 @@ class FieldParser:
                 )
         
         # Check enum constraint
-        if field_def.enum_values is not None:
-            if value not in field_def.enum_values:
+        if field_def._enum_set is not None:
+            if value not in field_def._enum_set:
                 return ParsedValue(
                     value=None,
                     is_valid=False,
                     error_message=f"Value not in allowed set: {field_def.enum_values}"
                 )
         
+        if field_def.intern_values:
+            value = sys.intern(value)
+        
         return ParsedValue(value=value, is_valid=True)
     
     @staticmethod
     def parse_number(value: str, field_def: FieldDefinition) -> ParsedValue:
         """Parse numeric field with range validation."""
-        try:
-            # Handle empty string
-            if not value or value.strip() == "":
-                if field_def.required:
-                    return ParsedValue(
-                        value=None,
-                        is_valid=False,
-                        error_message="Required field cannot be empty"
-                    )
-                else:
-                    return ParsedValue(value=None, is_valid=True)
-            
-            numeric_value = float(value)
-            
-            # Check range constraints
-            if field_def.min_value is not None and numeric_value < field_def.min_value:
-                return ParsedValue(
-                    value=None,
-                    is_valid=False,
-                    error_message=f"Value too small: {numeric_value} < {field_def.min_value}"
-                )
-            
-            if field_def.max_value is not None and numeric_value > field_def.max_value:
+        value = value.strip()
+        
+        # Handle empty string
+        if not value:
+            if field_def.required:
                 return ParsedValue(
                     value=None,
                     is_valid=False,
-                    error_message=f"Value too large: {numeric_value} > {field_def.max_value}"
+                    error_message="Required field cannot be empty"
                 )
-            
-            return ParsedValue(value=numeric_value, is_valid=True)
-            
-        except (ValueError, TypeError) as e:
+            else:
+                return ParsedValue(value=None, is_valid=True)
+        
+        # Check the format up front rather than paying for a raised ValueError
+        if not _NUMBER_PATTERN.fullmatch(value):
+            return ParsedValue(
+                value=None,
+                is_valid=False,
+                error_message=f"Invalid number format: {value!r}"
+            )
+        
+        numeric_value = float(value)
+        
+        # Check range constraints
+        if field_def.min_value is not None and numeric_value < field_def.min_value:
             return ParsedValue(
                 value=None,
                 is_valid=False,
-                error_message=f"Invalid number format: {e}"
+                error_message=f"Value too small: {numeric_value} < {field_def.min_value}"
             )
+        
+        if field_def.max_value is not None and numeric_value > field_def.max_value:
+            return ParsedValue(
+                value=None,
+                is_valid=False,
+                error_message=f"Value too large: {numeric_value} > {field_def.max_value}"
+            )
+        
+        return ParsedValue(value=numeric_value, is_valid=True)
     
     @staticmethod
     def parse_integer(value: str, field_def: FieldDefinition) -> ParsedValue:
         """Parse integer field with range validation."""
-        try:
-            # Handle empty string
-            if not value or value.strip() == "":
-                if field_def.required:
-                    return ParsedValue(
-                        value=None,
-                        is_valid=False,
-                        error_message="Required field cannot be empty"
-                    )
-                else:
-                    return ParsedValue(value=None, is_valid=True)
-            
-            # Check if it's a valid integer (no decimal point)
-            if '.' in value:
-                return ParsedValue(
-                    value=None,
-                    is_valid=False,
-                    error_message="Expected integer, got decimal number"
-                )
-            
-            integer_value = int(value)
-            
-            # Check range constraints
-            if field_def.min_value is not None and integer_value < field_def.min_value:
-                return ParsedValue(
-                    value=None,
-                    is_valid=False,
-                    error_message=f"Value too small: {integer_value} < {field_def.min_value}"
-                )
-            
-            if field_def.max_value is not None and integer_value > field_def.max_value:
+        value = value.strip()
+        
+        # Handle empty string
+        if not value:
+            if field_def.required:
                 return ParsedValue(
                     value=None,
                     is_valid=False,
-                    error_message=f"Value too large: {integer_value} > {field_def.max_value}"
+                    error_message="Required field cannot be empty"
                 )
-            
-            return ParsedValue(value=integer_value, is_valid=True)
-            
-        except (ValueError, TypeError) as e:
+            else:
+                return ParsedValue(value=None, is_valid=True)
+        
+        # Check if it's a valid integer (no decimal point)
+        if '.' in value:
+            return ParsedValue(
+                value=None,
+                is_valid=False,
+                error_message="Expected integer, got decimal number"
+            )
+        
+        if not _INTEGER_PATTERN.fullmatch(value):
             return ParsedValue(
                 value=None,
                 is_valid=False,
-                error_message=f"Invalid integer format: {e}"
+                error_message=f"Invalid integer format: {value!r}"
             )
+        
+        integer_value = int(value)
+        
+        # Check range constraints
+        if field_def.min_value is not None and integer_value < field_def.min_value:
+            return ParsedValue(
+                value=None,
+                is_valid=False,
+                error_message=f"Value too small: {integer_value} < {field_def.min_value}"
+            )
+        
+        if field_def.max_value is not None and integer_value > field_def.max_value:
+            return ParsedValue(
+                value=None,
+                is_valid=False,
+                error_message=f"Value too large: {integer_value} > {field_def.max_value}"
+            )
+        
+        return ParsedValue(value=integer_value, is_valid=True)
     
     @staticmethod
     def parse_boolean(value: str, field_def: FieldDefinition) -> ParsedValue:
@@ -175,12 +212,10 @@ class FieldParser:
             else:
                 return ParsedValue(value=None, is_valid=True)
         
-        value_lower = value.lower().strip()
+        parsed = _BOOLEAN_VALUES.get(value.lower().strip())
         
-        if value_lower in ['true', '1', 'yes', 'y']:
-            return ParsedValue(value=True, is_valid=True)
-        elif value_lower in ['false', '0', 'no', 'n']:
-            return ParsedValue(value=False, is_valid=True)
+        if parsed is not None:
+            return ParsedValue(value=parsed, is_valid=True)
         else:
             return ParsedValue(
                 value=None,
@@ -203,7 +238,7 @@ class FieldParser:
         
         try:
             # Parse JSON array
-            parsed_list = json.loads(value)
+            parsed_list = _json_loads(value)
             
             # Validate it's a list
             if not isinstance(parsed_list, list):
@@ -242,6 +277,72 @@ class FieldParser:
             )
 
 
+def _parse_unknown_type(value: str, field_def: FieldDefinition) -> ParsedValue:
+    """Reject values for fields whose type has no registered parser."""
+    return ParsedValue(
+        value=None,
+        is_valid=False,
+        error_message=f"Unknown field type: {field_def.field_type}"
+    )
+
+
+# Parser function for each field type, bound to schema fields once per CSVParser
+_TYPE_PARSERS = {
+    FieldType.STRING: FieldParser.parse_string,
+    FieldType.NUMBER: FieldParser.parse_number,
+    FieldType.INTEGER: FieldParser.parse_integer,
+    FieldType.BOOLEAN: FieldParser.parse_boolean,
+    FieldType.STRING_LIST: FieldParser.parse_string_list,
+}
+
+
+def _memoize_cells(parse_fn: Any, max_size: int) -> Any:
+    """Wrap a field parser so repeated cell strings reuse their ParsedValue."""
+    cache: Dict[str, ParsedValue] = {}
+    
+    def parse_cached(value: str, field_def: FieldDefinition) -> ParsedValue:
+        parsed = cache.get(value)
+        if parsed is None:
+            if len(cache) >= max_size:
+                cache.clear()
+            parsed = cache[value] = parse_fn(value, field_def)
+        return parsed
+    
+    return parse_cached
+
+
+# Parsed room (None on error) per row of a byte range, and (row index, error) pairs
+_RangeResult = Tuple[List[Optional[ParsedRoomData]], List[Tuple[int, ValidationError]]]
+
+
+def _parse_rows_in_range(file_path: str, start: int, end: int, fieldnames: List[str],
+                         delimiter: str, schema: RoomSchema) -> _RangeResult:
+    """
+    Parse the rows stored in bytes [start, end) of a CSV file.
+    
+    Module-level so it can be submitted to a process pool. Rows are indexed
+    from 0 within the range and parsed with row number 0 (unknown); the
+    caller assigns file-wide row numbers when merging.
+    
+    Returns:
+        Tuple of (parsed room or None for each row, (row index, error) pairs in row order)
+    """
+    with open(file_path, 'rb') as csvfile:
+        csvfile.seek(start)
+        chunk = csvfile.read(end - start).decode('utf-8')
+    
+    parser = CSVParser(schema)
+    row_plan = parser._get_row_plan(fieldnames)
+    reader = csv.reader(io.StringIO(chunk, newline=''), delimiter=delimiter)
+    rooms: List[Optional[ParsedRoomData]] = []
+    errors: List[Tuple[int, ValidationError]] = []
+    for index, row in enumerate(row for row in reader if row):
+        parsed_room, row_errors = parser._parse_row(row, 0, file_path, row_plan)
+        rooms.append(parsed_room)
+        errors.extend((index, error) for error in row_errors)
+    return rooms, errors
+
+
 class CSVParser:
     """
     CSV parser for millwork room specifications.
@@ -250,10 +351,32 @@ class CSVParser:
     the schema and validation rules from tech specifications.
     """
     
-    def __init__(self, schema: RoomSchema = None):
-        """Initialize parser with schema."""
+    # Files at least this large are split into byte ranges and parsed in a process pool
+    PARALLEL_THRESHOLD_BYTES = 16 * 1024 * 1024
+    # Read buffer for the serial path; rows are still consumed one at a time
+    READ_BUFFER_BYTES = 1024 * 1024
+    # Field types whose parsed values are immutable and repeat across rows
+    CACHED_FIELD_TYPES = frozenset({FieldType.NUMBER, FieldType.INTEGER, FieldType.BOOLEAN})
+    CELL_CACHE_SIZE = 1024
+    
+    def __init__(self, schema: RoomSchema = None, max_workers: Optional[int] = None):
+        """
+        Initialize parser with schema.
+        
+        Args:
+            schema: Room schema to validate against
+            max_workers: Worker processes for large files (defaults to CPU count)
+        """
         self.schema = schema or RoomSchema()
-        self.field_parser = FieldParser()
+        self.max_workers = max_workers
+    
+    def _resolve_parser(self, field_def: FieldDefinition) -> Any:
+        """Pick a field's parser, memoized when its cells are repeated immutable values."""
+        parse_fn = _TYPE_PARSERS.get(field_def.field_type, _parse_unknown_type)
+        # STRING_LIST values are mutable lists, so they stay uncached and unshared
+        if field_def.field_type in self.CACHED_FIELD_TYPES or field_def.intern_values:
+            return _memoize_cells(parse_fn, self.CELL_CACHE_SIZE)
+        return parse_fn
     
     def parse_file(self, file_path: Path) -> Tuple[List[ParsedRoomData], ValidationResult]:
         """
@@ -266,53 +389,62 @@ class CSVParser:
             Tuple of (parsed_data_list, validation_result)
         """
         validation_result = ValidationResult(is_valid=True, errors=[], warnings=[])
-        parsed_data = []
+        parsed_data = [room for room, _ in self.iter_rows(file_path, validation_result)]
+        return parsed_data, validation_result
+    
+    def parse_text(self, content: str, source_file: Optional[str] = None
+                   ) -> Tuple[List[ParsedRoomData], ValidationResult]:
+        """
+        Parse CSV content held in memory, without touching the filesystem.
         
+        Args:
+            content: CSV text including the header row
+            source_file: Name recorded on parsed rooms (None if not from a file)
+            
+        Returns:
+            Tuple of (parsed_data_list, validation_result)
+        """
+        validation_result = ValidationResult(is_valid=True, errors=[], warnings=[])
         try:
-            with open(file_path, 'r', encoding='utf-8') as csvfile:
-                # Detect delimiter
-                sample = csvfile.read(1024)
-                csvfile.seek(0)
-                
-                delimiter = ','
-                if '\t' in sample and sample.count('\t') > sample.count(','):
-                    delimiter = '\t'
-                
-                reader = csv.DictReader(csvfile, delimiter=delimiter)
-                
-                # Validate headers
-                if not self._validate_headers(reader.fieldnames, validation_result):
-                    return [], validation_result
-                
-                # Track room IDs for uniqueness validation
-                room_ids = set()
-                
-                for row_num, row in enumerate(reader, start=2):  # Start at 2 (header is row 1)
-                    row_result = self._parse_row(row, row_num, str(file_path))
-                    
-                    if row_result.is_valid:
-                        parsed_room = row_result.data
-                        
-                        # Check room_id uniqueness
-                        if parsed_room.room_id in room_ids:
-                            validation_result.add_error(
-                                "room_id", 
-                                f"Duplicate room_id: {parsed_room.room_id}", 
-                                parsed_room.room_id,
-                                row_num
-                            )
-                        else:
-                            room_ids.add(parsed_room.room_id)
-                            parsed_data.append(parsed_room)
-                    else:
-                        # Add row-level errors to overall validation result
-                        for error in row_result.errors:
-                            validation_result.add_error(
-                                error.field,
-                                error.message,
-                                error.value,
-                                row_num
-                            )
+            parsed_data = [room for room, _ in self._iter_stream(io.StringIO(content), source_file,
+                                                                 validation_result)]
+        except csv.Error as e:
+            validation_result.add_error("file", f"Error reading CSV content: {e}", source_file)
+            parsed_data = []
+        return parsed_data, validation_result
+    
+    def iter_rows(self, file_path: Path, validation_result: Optional[ValidationResult] = None
+                  ) -> Iterator[Tuple[ParsedRoomData, ValidationResult]]:
+        """
+        Stream valid rooms from a CSV file as they are parsed.
+        
+        Only one row is held in memory at a time. Each room is yielded with the
+        file-level validation result, which accumulates errors and warnings as
+        parsing proceeds and is complete once the iterator is exhausted.
+        
+        Args:
+            file_path: Path to CSV file
+            validation_result: Result to accumulate into (created if omitted)
+            
+        Yields:
+            Tuples of (parsed_room, validation_result)
+        """
+        if validation_result is None:
+            validation_result = ValidationResult(is_valid=True, errors=[], warnings=[])
+        
+        try:
+            # A pool only pays for itself when several workers share a large file;
+            # an empty file cannot be mapped, so it always streams
+            workers = self.max_workers or os.cpu_count() or 1
+            file_size = os.path.getsize(file_path)
+            if workers > 1 and file_size and file_size >= self.PARALLEL_THRESHOLD_BYTES:
+                yield from self._iter_rows_parallel(file_path, workers, validation_result)
+                return
+            
+            # newline='' leaves line endings to csv.reader, as the csv module expects
+            with open(file_path, 'r', encoding='utf-8', newline='',
+                      buffering=self.READ_BUFFER_BYTES) as csvfile:
+                yield from self._iter_stream(csvfile, str(file_path), validation_result)
                 
         except FileNotFoundError:
             validation_result.add_error("file", f"File not found: {file_path}", str(file_path))
@@ -320,22 +452,169 @@ class CSVParser:
             validation_result.add_error("file", f"Permission denied: {file_path}", str(file_path))
         except Exception as e:
             validation_result.add_error("file", f"Error reading file: {e}", str(file_path))
-        
-        return parsed_data, validation_result
     
-    def _validate_headers(self, headers: List[str], validation_result: ValidationResult) -> bool:
-        """Validate CSV headers against schema."""
+    def _iter_stream(self, csvfile: IO[str], source_file: Optional[str],
+                     validation_result: ValidationResult
+                     ) -> Iterator[Tuple[ParsedRoomData, ValidationResult]]:
+        """Stream valid rooms from an open text stream positioned at the header."""
+        # Detect delimiter from the header row; data rows may hold commas in list cells
+        header_line = csvfile.readline()
+        csvfile.seek(0)
+        
+        # csv.reader tokenises in C and streams; per-field validation,
+        # not the read, dominates parse time, so no bulk frame reader
+        reader = csv.reader(csvfile, delimiter=self._detect_delimiter(header_line))
+        headers = next(reader, None)
+        
+        # Validate headers
         if headers is None:
             validation_result.add_error("headers", "No headers found in CSV file", None)
+            return
+        if not self._validate_headers(headers, validation_result):
+            return
+        
+        row_plan = self._get_row_plan(headers)
+        
+        # Track room IDs for uniqueness validation
+        room_ids: Set[str] = set()
+        
+        # Blank lines are skipped; start at 2 (header is row 1)
+        for row_num, row in enumerate((row for row in reader if row), start=2):
+            parsed_room, row_errors = self._parse_row(row, row_num, source_file, row_plan)
+            if parsed_room is None:
+                validation_result.add_errors(row_errors)
+            elif self._register_room_id(parsed_room, row_num, room_ids, validation_result):
+                yield parsed_room, validation_result
+    
+    def _iter_rows_parallel(self, file_path: Path, workers: int, validation_result: ValidationResult
+                            ) -> Iterator[Tuple[ParsedRoomData, ValidationResult]]:
+        """
+        Parse a large CSV file by splitting it into newline-aligned byte ranges.
+        
+        Each range is parsed in a worker process; results are merged in file
+        order so row numbers and duplicate room_id detection match the serial path.
+        """
+        with open(file_path, 'rb') as csvfile:
+            with mmap.mmap(csvfile.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                file_size = len(mapped)
+                header_end = mapped.find(b'\n') + 1 or file_size
+                header_line = mapped[:header_end].decode('utf-8')
+                delimiter = self._detect_delimiter(header_line)
+                fieldnames = next(csv.reader([header_line], delimiter=delimiter), None)
+                
+                if fieldnames is None:
+                    validation_result.add_error("headers", "No headers found in CSV file", None)
+                    return
+                if not self._validate_headers(fieldnames, validation_result):
+                    return
+                
+                # Split the body into one range per worker, each ending on a record boundary
+                chunk_size = max(1, -(-(file_size - header_end) // workers))
+                ranges = []
+                start = header_end
+                while start < file_size:
+                    end = mapped.rfind(b'\n', start, min(start + chunk_size, file_size)) + 1
+                    if end <= start:
+                        # No newline inside the target window; extend to the next one
+                        end = mapped.find(b'\n', start + chunk_size) + 1 or file_size
+                    
+                    # Ranges start outside quotes, so an odd quote count means the cut
+                    # fell inside a quoted cell (escaped "" keeps the parity); move on
+                    # to the next newline until the quotes balance
+                    quote_count = mapped[start:end].count(b'"')
+                    while quote_count % 2 and end < file_size:
+                        next_end = mapped.find(b'\n', end) + 1 or file_size
+                        quote_count += mapped[end:next_end].count(b'"')
+                        end = next_end
+                    
+                    ranges.append((start, end))
+                    start = end
+        
+        source_file = str(file_path)
+        range_args = [(source_file, start, end, fieldnames, delimiter, self.schema) for start, end in ranges]
+        if len(range_args) <= 1:
+            # A single range (e.g. one huge quoted cell) gains nothing from a pool
+            yield from self._merge_ranges((_parse_rows_in_range(*args) for args in range_args),
+                                          validation_result)
+            return
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_parse_rows_in_range, *args) for args in range_args]
+            yield from self._merge_ranges((future.result() for future in futures), validation_result)
+    
+    def _merge_ranges(self, range_results: Iterator[_RangeResult], validation_result: ValidationResult
+                      ) -> Iterator[Tuple[ParsedRoomData, ValidationResult]]:
+        """Merge per-range parse results in file order, assigning file-wide row numbers."""
+        room_ids: Set[str] = set()
+        first_row_num = 2  # Header is row 1
+        for rooms, errors in range_results:
+            # Group each row's errors under its range-local index, numbered file-wide
+            row_errors: Dict[int, List[ValidationError]] = {}
+            for index, error in errors:
+                error.row_number = first_row_num + index
+                row_errors.setdefault(index, []).append(error)
+            
+            for index, parsed_room in enumerate(rooms):
+                row_num = first_row_num + index
+                if parsed_room is None:
+                    validation_result.add_errors(row_errors[index])
+                    continue
+                
+                parsed_room.row_number = row_num
+                if self._register_room_id(parsed_room, row_num, room_ids, validation_result):
+                    yield parsed_room, validation_result
+            
+            first_row_num += len(rooms)
+    
+    @staticmethod
+    def _detect_delimiter(header_line: str) -> str:
+        """Pick tab when the header line contains more tabs than commas."""
+        if '\t' in header_line and header_line.count('\t') > header_line.count(','):
+            return '\t'
+        return ','
+    
+    def _get_row_plan(self, headers: List[str]) -> List[Tuple[str, FieldDefinition, Any, Optional[int]]]:
+        """
+        Specialise the schema's field parsers to a concrete header row.
+        
+        Each entry is (field_name, field_def, parse_fn, column_index), with a
+        column index of None for schema fields absent from the file, so rows
+        are read by position with no per-row dict or per-cell type dispatch.
+        A plan is built once per parse, so memoized cells never outlive one file.
+        """
+        # Later duplicate headers win, matching csv.DictReader
+        columns = {header: index for index, header in enumerate(headers)}
+        return [
+            (field_name, field_def, self._resolve_parser(field_def), columns.get(field_name))
+            for field_name, field_def in self.schema.get_all_fields().items()
+        ]
+    
+    def _register_room_id(self, parsed_room: ParsedRoomData, row_num: int, room_ids: Set[str],
+                          validation_result: ValidationResult) -> bool:
+        """Record a room's ID, reporting an error and returning False if it was already seen."""
+        # A set that does not grow on add() already held the ID: one hash, not two
+        seen_count = len(room_ids)
+        room_ids.add(parsed_room.room_id)
+        if len(room_ids) == seen_count:
+            validation_result.add_error(
+                "room_id", 
+                f"Duplicate room_id: {parsed_room.room_id}", 
+                parsed_room.room_id,
+                row_number=row_num
+            )
             return False
         
-        # Check for required fields
-        required_fields = self.schema.get_required_field_names()
-        missing_fields = []
+        return True
+    
+    def _validate_headers(self, headers: List[str], validation_result: ValidationResult) -> bool:
+        """Validate CSV headers against schema."""
+        header_set = set(headers)
         
-        for field in required_fields:
-            if field not in headers:
-                missing_fields.append(field)
+        # Check for required fields
+        missing_fields = [
+            field for field in self.schema.get_required_field_names()
+            if field not in header_set
+        ]
         
         if missing_fields:
             validation_result.add_error(
@@ -346,12 +625,8 @@ class CSVParser:
             return False
         
         # Check for unknown fields
-        all_valid_fields = self.schema.get_all_field_names()
-        unknown_fields = []
-        
-        for header in headers:
-            if header not in all_valid_fields:
-                unknown_fields.append(header)
+        all_valid_fields = self.schema.ALL_FIELD_NAMES
+        unknown_fields = [header for header in headers if header not in all_valid_fields]
         
         if unknown_fields:
             validation_result.add_warning(
@@ -362,73 +637,66 @@ class CSVParser:
         
         return True
     
-    def _parse_row(self, row: Dict[str, str], row_num: int, source_file: str) -> ValidationResult:
-        """Parse a single CSV row."""
-        result = ValidationResult(is_valid=True, errors=[], warnings=[])
+    def _parse_row(self, row: List[str], row_num: int, source_file: Optional[str],
+                   row_plan: List[Tuple[str, FieldDefinition, Any, Optional[int]]]
+                   ) -> Tuple[Optional[ParsedRoomData], List[ValidationError]]:
+        """
+        Parse a single CSV row using a plan from _get_row_plan.
+        
+        Field errors are collected with row_num for the caller to merge in one
+        add_errors call. Returns (None, errors) if the row had errors.
+        """
+        row_errors: List[ValidationError] = []
         parsed_values = {}
+        row_length = len(row)
         
         # Parse each field according to schema
-        all_fields = self.schema.get_all_fields()
-        
-        for field_name, field_def in all_fields.items():
-            raw_value = row.get(field_name, "").strip()
+        for field_name, field_def, parse_fn, column in row_plan:
+            # Missing columns and short rows read as empty
+            raw_value = row[column].strip() if column is not None and column < row_length else ""
             
             # Handle required field validation
             if field_def.required and not raw_value:
-                result.add_error(field_name, "Required field is empty", raw_value, row_num)
+                row_errors.append(ValidationError(field_name, "Required field is empty", raw_value,
+                                                  row_number=row_num, error_type="error"))
                 continue
             
             # Parse based on field type
-            parsed_value = self._parse_field_value(raw_value, field_def)
+            parsed_value = parse_fn(raw_value, field_def)
             
             if not parsed_value.is_valid:
-                result.add_error(field_name, parsed_value.error_message, raw_value, row_num)
+                row_errors.append(ValidationError(field_name, parsed_value.error_message, raw_value,
+                                                  row_number=row_num, error_type="error"))
             else:
                 parsed_values[field_name] = parsed_value.value
         
-        # If parsing succeeded, create ParsedRoomData object
-        if result.is_valid:
-            try:
-                parsed_room = ParsedRoomData(
-                    room_id=parsed_values.get("room_id"),
-                    total_length_in=parsed_values.get("total_length_in"),
-                    num_modules=parsed_values.get("num_modules"),
-                    module_widths=parsed_values.get("module_widths", []),
-                    material_top=parsed_values.get("material_top"),
-                    material_casework=parsed_values.get("material_casework"),
-                    left_filler_in=parsed_values.get("left_filler_in", 0.0),
-                    right_filler_in=parsed_values.get("right_filler_in", 0.0),
-                    has_sink=parsed_values.get("has_sink", False),
-                    has_ref=parsed_values.get("has_ref", False),
-                    counter_height_in=parsed_values.get("counter_height_in"),
-                    edge_rule=parsed_values.get("edge_rule"),
-                    hardware_defaults=parsed_values.get("hardware_defaults"),
-                    notes=parsed_values.get("notes"),
-                    references=parsed_values.get("references"),
-                    row_number=row_num,
-                    source_file=source_file,
-                )
-                result.data = parsed_room
-            except Exception as e:
-                result.add_error("row", f"Error creating parsed data: {e}", None, row_num)
+        if row_errors:
+            return None, row_errors
         
-        return result
-    
-    def _parse_field_value(self, value: str, field_def: FieldDefinition) -> ParsedValue:
-        """Parse field value based on its type definition."""
-        if field_def.field_type == FieldType.STRING:
-            return self.field_parser.parse_string(value, field_def)
-        elif field_def.field_type == FieldType.NUMBER:
-            return self.field_parser.parse_number(value, field_def)
-        elif field_def.field_type == FieldType.INTEGER:
-            return self.field_parser.parse_integer(value, field_def)
-        elif field_def.field_type == FieldType.BOOLEAN:
-            return self.field_parser.parse_boolean(value, field_def)
-        elif field_def.field_type == FieldType.STRING_LIST:
-            return self.field_parser.parse_string_list(value, field_def)
-        else:
-            return ParsedValue(
-                value=None,
-                is_valid=False,
-                error_message=f"Unknown field type: {field_def.field_type}"
-            )
\ No newline at end of file
+        # Parsing succeeded, create ParsedRoomData object
+        try:
+            parsed_room = ParsedRoomData(
+                room_id=parsed_values.get("room_id"),
+                total_length_in=parsed_values.get("total_length_in"),
+                num_modules=parsed_values.get("num_modules"),
+                module_widths=parsed_values.get("module_widths", []),
+                material_top=parsed_values.get("material_top"),
+                material_casework=parsed_values.get("material_casework"),
+                left_filler_in=parsed_values.get("left_filler_in", 0.0),
+                right_filler_in=parsed_values.get("right_filler_in", 0.0),
+                has_sink=parsed_values.get("has_sink", False),
+                has_ref=parsed_values.get("has_ref", False),
+                counter_height_in=parsed_values.get("counter_height_in"),
+                edge_rule=parsed_values.get("edge_rule"),
+                hardware_defaults=parsed_values.get("hardware_defaults"),
+                notes=parsed_values.get("notes"),
+                references=parsed_values.get("references"),
+                row_number=row_num,
+                source_file=source_file,
+            )
+        except Exception as e:
+            row_errors.append(ValidationError("row", f"Error creating parsed data: {e}", None,
+                                              row_number=row_num, error_type="error"))
+            return None, row_errors
+        
+        return parsed_room, row_errors
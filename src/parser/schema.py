@@ -5,11 +5,82 @@ Implements the schema defined in tech_specs.md section 3.1 with comprehensive
 field definitions, types, and validation constraints.
 """
 
+import re
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Union
+from typing import List, Dict, Any, FrozenSet, Optional, Pattern, Tuple, Union
 from enum import Enum
 
 
+# A quantifier, optionally lazy or possessive; group 1 is the quantifier itself
+_QUANTIFIER = re.compile(r'([+*?]|\{\d*(?:,\d*)?\})[?+]?')
+
+
+def _quantifier_at(pattern: str, index: int) -> Tuple[int, bool]:
+    """Return the index after any quantifier at index and whether it is unbounded."""
+    match = _QUANTIFIER.match(pattern, index)
+    if match is None:
+        return index, False
+    quantifier = match.group(1)
+    return match.end(), quantifier in ('+', '*') or quantifier.endswith(',}')
+
+
+def _nests_unbounded_quantifiers(pattern: str) -> bool:
+    """
+    Report whether an unboundedly repeated group can end in an unbounded quantifier.
+    
+    Groups such as (a+)+, ((a+))* or (a+|b){2,} can split the same input many
+    ways and backtrack exponentially on near-miss input. A body ending in a
+    literal, as in (\d+,)*, splits input only one way and is allowed. Only the
+    last atom of each alternative is checked, so a trailing optional atom, as
+    in (a+b?)+, is not looked through.
+    """
+    # For each open group, whether an alternative already closed ended unbounded
+    open_groups: List[bool] = []
+    tail_unbounded = False  # The current alternative's last atom ends unbounded
+    index = 0
+    while index < len(pattern):
+        char = pattern[index]
+        if char == '(':
+            open_groups.append(False)
+            index += 1
+            # Skip the (?:, (?=, (?P<name> ... prefix of special groups
+            if pattern.startswith('?P<', index):
+                index = pattern.find('>', index) + 1 or len(pattern)
+            elif pattern.startswith('?', index):
+                index += 2
+            tail_unbounded = False
+            continue
+        if char == '|':
+            if open_groups:
+                open_groups[-1] = open_groups[-1] or tail_unbounded
+            tail_unbounded = False
+            index += 1
+            continue
+        
+        if char == ')':
+            atom_unbounded = tail_unbounded or (open_groups.pop() if open_groups else False)
+            index, quantifier_unbounded = _quantifier_at(pattern, index + 1)
+            if quantifier_unbounded and atom_unbounded:
+                return True
+        else:
+            if char == '\\':
+                index += 2
+            elif char == '[':
+                # Skip the class; a leading ] (after an optional ^) is a member
+                index += 2 if pattern.startswith('[^', index) else 1
+                if pattern.startswith(']', index):
+                    index += 1
+                while index < len(pattern) and pattern[index] != ']':
+                    index += 2 if pattern[index] == '\\' else 1
+                index += 1
+            else:
+                index += 1
+            atom_unbounded = False
+            index, quantifier_unbounded = _quantifier_at(pattern, index)
+        tail_unbounded = atom_unbounded or quantifier_unbounded
+    return False
+
+
 class FieldType(Enum):
     """Field type enumeration for schema validation."""
     STRING = "string"
@@ -32,13 +103,27 @@ class FieldDefinition:
     pattern: Optional[str] = None
     enum_values: Optional[List[str]] = None
     description: str = ""
+    intern_values: bool = False  # Codes repeated across rows share one string object
+    
+    # Hashed copy of enum_values for O(1) membership checks while parsing
+    _enum_set: Optional[FrozenSet[str]] = field(default=None, init=False, repr=False, compare=False)
+    # pattern compiled once per field rather than looked up per cell
+    _compiled_pattern: Optional[Pattern[str]] = field(default=None, init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Validate field definition consistency."""
-        if self.field_type == FieldType.STRING_LIST and self.min_value is not None:
+        if self.enum_values is not None:
+            self._enum_set = frozenset(self.enum_values)
+        
+        if self.pattern is not None:
+            if _nests_unbounded_quantifiers(self.pattern):
+                raise ValueError(f"pattern for field {self.name} nests unbounded quantifiers: {self.pattern}")
+            self._compiled_pattern = re.compile(self.pattern)
+        
+        if self.field_type is FieldType.STRING_LIST and self.min_value is not None:
             raise ValueError(f"min_value not applicable for STRING_LIST field {self.name}")
         
-        if self.field_type in [FieldType.NUMBER, FieldType.INTEGER] and self.min_length is not None:
+        if self.field_type in (FieldType.NUMBER, FieldType.INTEGER) and self.min_length is not None:
             raise ValueError(f"min_length not applicable for numeric field {self.name}")
 
 
@@ -90,7 +175,8 @@ class RoomSchema:
             min_length=1,
             max_length=20,
             pattern=r'^[A-Z0-9\-_]+$',
-            description="Top material code (e.g., 'QTZ-01')"
+            description="Top material code (e.g., 'QTZ-01')",
+            intern_values=True
         ),
         FieldDefinition(
             name="material_casework",
@@ -99,7 +185,8 @@ class RoomSchema:
             min_length=1,
             max_length=20,
             pattern=r'^[A-Z0-9\-_]+$',
-            description="Casework material code (e.g., 'PLM-WHT')"
+            description="Casework material code (e.g., 'PLM-WHT')",
+            intern_values=True
         ),
     ]
     
@@ -145,13 +232,15 @@ class RoomSchema:
             name="edge_rule",
             field_type=FieldType.STRING,
             required=False,
-            description="Edge treatment rule (validated against CFG.EDGE_RULES)"
+            description="Edge treatment rule (validated against CFG.EDGE_RULES)",
+            intern_values=True
         ),
         FieldDefinition(
             name="hardware_defaults",
             field_type=FieldType.STRING,
             required=False,
-            description="Hardware defaults key (validated against CFG.HW.DEFAULTS)"
+            description="Hardware defaults key (validated against CFG.HW.DEFAULTS)",
+            intern_values=True
         ),
         FieldDefinition(
             name="notes",
@@ -169,15 +258,16 @@ class RoomSchema:
         ),
     ]
     
+    # Name lookups derived once from the field lists above
+    REQUIRED_FIELD_NAMES: FrozenSet[str] = frozenset(f.name for f in REQUIRED_FIELDS)
+    OPTIONAL_FIELD_NAMES: FrozenSet[str] = frozenset(f.name for f in OPTIONAL_FIELDS)
+    ALL_FIELD_NAMES: FrozenSet[str] = REQUIRED_FIELD_NAMES | OPTIONAL_FIELD_NAMES
+    _FIELDS_BY_NAME: Dict[str, FieldDefinition] = {f.name: f for f in REQUIRED_FIELDS + OPTIONAL_FIELDS}
+    
     @classmethod
     def get_all_fields(cls) -> Dict[str, FieldDefinition]:
         """Get all field definitions as a dictionary."""
-        all_fields = {}
-        
-        for field_def in cls.REQUIRED_FIELDS + cls.OPTIONAL_FIELDS:
-            all_fields[field_def.name] = field_def
-        
-        return all_fields
+        return dict(cls._FIELDS_BY_NAME)
     
     @classmethod
     def get_required_field_names(cls) -> List[str]:
@@ -197,13 +287,12 @@ class RoomSchema:
     @classmethod
     def is_valid_field(cls, field_name: str) -> bool:
         """Check if field name is valid in schema."""
-        return field_name in cls.get_all_field_names()
+        return field_name in cls.ALL_FIELD_NAMES
     
     @classmethod
     def get_field_definition(cls, field_name: str) -> Optional[FieldDefinition]:
         """Get field definition by name."""
-        all_fields = cls.get_all_fields()
-        return all_fields.get(field_name)
+        return cls._FIELDS_BY_NAME.get(field_name)
 
 
 @dataclass
@@ -8,13 +8,35 @@ Implements the IValidator interface with all validation categories:
 """
 
 import json
+import math
+import os
+import sys
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set
+from types import ModuleType
+from typing import Dict, Any, FrozenSet, Iterable, Iterator, List, Optional, Set, Tuple
 from dataclasses import dataclass
 
 from .schema import ParsedRoomData
 from ..core.interfaces import IValidator, ValidationResult
 
+orjson: Optional[ModuleType]
+try:
+    import orjson
+except ImportError:  # Optional: falls back to the stdlib encoder
+    orjson = None
+
+
+def _write_json(path: Path, report: Dict[str, Any]) -> None:
+    """Write a report as indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        path.write_bytes(orjson.dumps(report, option=orjson.OPT_INDENT_2, default=str))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, default=str)
+
 
 @dataclass
 class BatchValidationSummary:
@@ -25,11 +47,62 @@ class BatchValidationSummary:
     validation_errors: List[str] = None
     error_reasons: Dict[str, int] = None
     
+    # Only this many messages are reported in summary.json, so no more are kept
+    MAX_VALIDATION_ERRORS = 50
+    
     def __post_init__(self):
         if self.validation_errors is None:
             self.validation_errors = []
         if self.error_reasons is None:
-            self.error_reasons = {}
+            self.error_reasons = Counter()
+    
+    def record_error(self, category: str, message: str) -> None:
+        """Count an error under category, keeping its message while under the cap."""
+        self.error_reasons[category] += 1
+        if len(self.validation_errors) < self.MAX_VALIDATION_ERRORS:
+            self.validation_errors.append(message)
+
+
+def _interned_set(values: Iterable[Any]) -> FrozenSet[str]:
+    """Build a frozenset with string members interned for identity-first comparison."""
+    return frozenset(sys.intern(value) if isinstance(value, str) else value for value in values)
+
+
+@dataclass(frozen=True)
+class _CompiledConfig:
+    """Validation constants resolved once from a configuration dictionary."""
+    length_tolerance: float
+    materials: FrozenSet[str]
+    edge_rules: FrozenSet[str]
+    edge_rule_options: List[str]
+    hw_defaults: FrozenSet[str]
+    hw_default_options: List[str]
+    ada_min_height: Optional[float]  # None when no ADA range is configured
+    ada_max_height: Optional[float]
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "_CompiledConfig":
+        """Build compiled constants from a configuration dictionary."""
+        edge_rules = config.get("EDGE_RULES", [])
+        hw_defaults = config.get("HW", {}).get("DEFAULTS", {})
+        
+        ada_min_height = ada_max_height = None
+        ada_config = config.get("ADA", {})
+        if ada_config:
+            counter_range = ada_config.get("COUNTER_RANGE", [28, 34])
+            if isinstance(counter_range, list) and len(counter_range) == 2:
+                ada_min_height, ada_max_height = counter_range
+        
+        return cls(
+            length_tolerance=config.get("TOLERANCES", {}).get("LENGTH_SUM", 0.125),  # Default 1/8"
+            materials=_interned_set(config.get("MATERIALS", {})),
+            edge_rules=_interned_set(edge_rules),
+            edge_rule_options=edge_rules,
+            hw_defaults=_interned_set(hw_defaults),
+            hw_default_options=list(hw_defaults.keys()),
+            ada_min_height=ada_min_height,
+            ada_max_height=ada_max_height
+        )
 
 
 class RoomValidator(IValidator):
@@ -42,14 +115,35 @@ class RoomValidator(IValidator):
     - Referential Integrity validation (4.3)
     """
     
-    def __init__(self, strict_mode: bool = False):
+    # Batches at least this large are validated across worker processes
+    PARALLEL_THRESHOLD_ROOMS = 20000
+    
+    def __init__(self, strict_mode: bool = False, max_workers: Optional[int] = None):
         """
         Initialize validator.
         
         Args:
             strict_mode: If True, treat warnings as errors
+            max_workers: Worker processes for large batches (defaults to CPU count)
         """
         self.strict_mode = strict_mode
+        self.max_workers = max_workers
+        self._compiled_source: Optional[Dict[str, Any]] = None
+        self._compiled: Optional[_CompiledConfig] = None
+    
+    def invalidate_config(self) -> None:
+        """Drop the compiled configuration; call after editing a config dict in place."""
+        self._compiled_source = None
+        self._compiled = None
+    
+    def _compile_config(self, config: Dict[str, Any]) -> _CompiledConfig:
+        """Return compiled constants for config, reused while the same dict is passed."""
+        compiled = self._compiled
+        # Holding the dict itself (not its id) means a reused id can't match
+        if compiled is None or config is not self._compiled_source:
+            compiled = self._compiled = _CompiledConfig.from_config(config)
+            self._compiled_source = config
+        return compiled
     
     def validate_type_and_domain(self, data: Dict[str, Any], 
                                 config: Dict[str, Any]) -> ValidationResult:
@@ -60,9 +154,18 @@ class RoomValidator(IValidator):
         additional domain-specific validations.
         """
         result = ValidationResult(is_valid=True, errors=[], warnings=[])
-        
-        # Additional domain validations beyond basic type checking
-        
+        self._check_type_and_domain(data, self._compile_config(config), result)
+        return result
+    
+    def _check_type_and_domain(self, data: Dict[str, Any], compiled: _CompiledConfig,
+                               result: ValidationResult) -> None:
+        """Add type and domain findings for data to result."""
+        self._check_room_id(data, result)
+        self._check_domain(data, compiled, result)
+    
+    @staticmethod
+    def _check_room_id(data: Dict[str, Any], result: ValidationResult) -> None:
+        """Add room_id format findings for data to result."""
         # Validate room_id format and uniqueness (handled at batch level)
         room_id = data.get("room_id")
         if room_id is not None:
@@ -70,6 +173,11 @@ class RoomValidator(IValidator):
                 result.add_error("room_id", "Room ID must be non-empty string", room_id)
             elif len(room_id) > 50:
                 result.add_error("room_id", "Room ID too long (max 50 characters)", room_id)
+    
+    def _check_domain(self, data: Dict[str, Any], compiled: _CompiledConfig,
+                      result: ValidationResult) -> None:
+        """Add domain findings, other than room_id format, for data to result."""
+        # Additional domain validations beyond basic type checking
         
         # Validate num_modules consistency with module_widths length
         num_modules = data.get("num_modules")
@@ -84,7 +192,7 @@ class RoomValidator(IValidator):
                 )
         
         # Validate material codes format (if configuration defines valid codes)
-        material_codes = config.get("MATERIALS", {})
+        material_codes = compiled.materials
         if material_codes:
             for material_field in ["material_top", "material_casework"]:
                 material_code = data.get(material_field)
@@ -107,8 +215,6 @@ class RoomValidator(IValidator):
             value = data.get(bool_field)
             if value is not None and not isinstance(value, bool):
                 result.add_error(bool_field, f"Expected boolean, got {type(value)}", value)
-        
-        return result
     
     def validate_geometric_consistency(self, data: Dict[str, Any],
                                      config: Dict[str, Any]) -> ValidationResult:
@@ -121,10 +227,14 @@ class RoomValidator(IValidator):
         - Reasonable filler dimensions
         """
         result = ValidationResult(is_valid=True, errors=[], warnings=[])
-        
+        self._check_geometric_consistency(data, self._compile_config(config), result)
+        return result
+    
+    def _check_geometric_consistency(self, data: Dict[str, Any], compiled: _CompiledConfig,
+                                     result: ValidationResult) -> None:
+        """Add geometric consistency findings for data to result."""
         # Get tolerance settings from configuration
-        tolerances = config.get("TOLERANCES", {})
-        length_tolerance = tolerances.get("LENGTH_SUM", 0.125)  # Default 1/8"
+        length_tolerance = compiled.length_tolerance
         
         # Validate module width sum
         total_length = data.get("total_length_in")
@@ -133,8 +243,9 @@ class RoomValidator(IValidator):
         right_filler = data.get("right_filler_in", 0.0)
         
         if total_length is not None and module_widths:
-            # Calculate total module width + fillers
-            module_sum = sum(module_widths)
+            # Calculate total module width + fillers; fsum keeps the sum exact
+            # enough that rounding never decides the 1/8" tolerance check
+            module_sum = math.fsum(module_widths)
             total_with_fillers = module_sum + left_filler + right_filler
             
             # Check if within tolerance
@@ -154,8 +265,9 @@ class RoomValidator(IValidator):
                     }
                 )
         
-        # Validate individual module widths are reasonable
-        if module_widths:
+        # Validate individual module widths are reasonable; min/max reduce in C,
+        # so the per-module loop only runs when some width needs a message
+        if module_widths and not (6 <= min(module_widths) and max(module_widths) <= 60):
             for i, width in enumerate(module_widths):
                 if width <= 0:
                     result.add_error(
@@ -178,18 +290,16 @@ class RoomValidator(IValidator):
         
         # Validate ADA compliance for counter heights
         counter_height = data.get("counter_height_in")
-        ada_config = config.get("ADA", {})
+        min_height = compiled.ada_min_height
         
-        if counter_height is not None and ada_config:
-            counter_range = ada_config.get("COUNTER_RANGE", [28, 34])
-            if isinstance(counter_range, list) and len(counter_range) == 2:
-                min_height, max_height = counter_range
-                if counter_height < min_height or counter_height > max_height:
-                    result.add_warning(
-                        "counter_height_in",
-                        f"Counter height {counter_height}\" outside ADA range [{min_height}\", {max_height}\"]",
-                        counter_height
-                    )
+        if counter_height is not None and min_height is not None:
+            max_height = compiled.ada_max_height
+            if counter_height < min_height or counter_height > max_height:
+                result.add_warning(
+                    "counter_height_in",
+                    f"Counter height {counter_height}\" outside ADA range [{min_height}\", {max_height}\"]",
+                    counter_height
+                )
         
         # Validate filler dimensions are reasonable
         for filler_field in ["left_filler_in", "right_filler_in"]:
@@ -202,8 +312,6 @@ class RoomValidator(IValidator):
                     f"Large filler width: {filler_width}\" (consider adjusting module sizes)",
                     filler_width
                 )
-        
-        return result
     
     def validate_referential_integrity(self, data: Dict[str, Any],
                                       config: Dict[str, Any]) -> ValidationResult:
@@ -216,32 +324,36 @@ class RoomValidator(IValidator):
         - Material codes reference valid materials (if configured)
         """
         result = ValidationResult(is_valid=True, errors=[], warnings=[])
-        
+        self._check_referential_integrity(data, self._compile_config(config), result)
+        return result
+    
+    def _check_referential_integrity(self, data: Dict[str, Any], compiled: _CompiledConfig,
+                                     result: ValidationResult) -> None:
+        """Add referential integrity findings for data to result."""
         # Validate edge_rule against configuration
         edge_rule = data.get("edge_rule")
         if edge_rule is not None and edge_rule != "":
-            edge_rules = config.get("EDGE_RULES", [])
+            edge_rules = compiled.edge_rules
             if edge_rules and edge_rule not in edge_rules:
                 result.add_error(
                     "edge_rule",
-                    f"Invalid edge rule '{edge_rule}'. Valid options: {edge_rules}",
+                    f"Invalid edge rule '{edge_rule}'. Valid options: {compiled.edge_rule_options}",
                     edge_rule
                 )
         
         # Validate hardware_defaults against configuration
         hardware_defaults = data.get("hardware_defaults")
         if hardware_defaults is not None and hardware_defaults != "":
-            hw_config = config.get("HW", {})
-            hw_defaults = hw_config.get("DEFAULTS", {})
+            hw_defaults = compiled.hw_defaults
             if hw_defaults and hardware_defaults not in hw_defaults:
                 result.add_error(
                     "hardware_defaults",
-                    f"Invalid hardware defaults '{hardware_defaults}'. Valid options: {list(hw_defaults.keys())}",
+                    f"Invalid hardware defaults '{hardware_defaults}'. Valid options: {compiled.hw_default_options}",
                     hardware_defaults
                 )
         
         # Validate material codes against configuration (if material catalog is defined)
-        materials_config = config.get("MATERIALS", {})
+        materials_config = compiled.materials
         if materials_config:
             for material_field in ["material_top", "material_casework"]:
                 material_code = data.get(material_field)
@@ -258,14 +370,15 @@ class RoomValidator(IValidator):
                             f"Material code '{material_code}' not in configuration catalog",
                             material_code
                         )
-        
-        return result
     
     def validate_room_data(self, room_data: ParsedRoomData, 
                           config: Dict[str, Any]) -> ValidationResult:
         """
         Validate a single room's data using all validation categories.
         
+        The compiled configuration is reused while the same dict is passed;
+        call invalidate_config() after editing that dict in place.
+        
         Args:
             room_data: Parsed room data
             config: Configuration dictionary
@@ -273,20 +386,23 @@ class RoomValidator(IValidator):
         Returns:
             ValidationResult with all validation errors and warnings
         """
+        return self._validate_room(room_data, self._compile_config(config))
+    
+    def _validate_room(self, room_data: ParsedRoomData, compiled: _CompiledConfig) -> ValidationResult:
+        """Validate a single room against already compiled configuration constants."""
         combined_result = ValidationResult(is_valid=True, errors=[], warnings=[])
         
-        # Convert room data to dictionary for validation methods
-        data_dict = room_data.to_dict()
+        # Validation methods read fields by key; the dataclass's own attribute
+        # dict has the same keys as to_dict() without building a copy per room.
+        # The checks only read from it.
+        data_dict = vars(room_data)
         
-        # Run all validation categories
-        type_result = self.validate_type_and_domain(data_dict, config)
-        geometric_result = self.validate_geometric_consistency(data_dict, config)
-        referential_result = self.validate_referential_integrity(data_dict, config)
-        
-        # Combine results
-        combined_result.merge(type_result)
-        combined_result.merge(geometric_result)
-        combined_result.merge(referential_result)
+        # Run all validation categories straight into one result, so a clean
+        # room allocates no per-category results to merge
+        self._check_room_id(data_dict, combined_result)
+        self._check_domain(data_dict, compiled, combined_result)
+        self._check_geometric_consistency(data_dict, compiled, combined_result)
+        self._check_referential_integrity(data_dict, compiled, combined_result)
         
         return combined_result
     
@@ -309,36 +425,81 @@ class RoomValidator(IValidator):
         summary = BatchValidationSummary()
         summary.total_rows = len(rooms_data)
         
-        # Track room IDs for uniqueness validation
-        room_ids = set()
+        # Find duplicated room IDs in one pass; only those need tracking below
+        id_counts = Counter(room_data.room_id for room_data in rooms_data)
+        duplicate_ids = {room_id for room_id, count in id_counts.items() if count > 1}
+        seen_duplicate_ids = set()
         
+        # Check room ID uniqueness across batch; the first occurrence is kept
+        is_duplicate = []
         for room_data in rooms_data:
-            # Check room ID uniqueness across batch
-            if room_data.room_id in room_ids:
+            duplicate = False
+            if room_data.room_id in duplicate_ids:
+                duplicate = room_data.room_id in seen_duplicate_ids
+                seen_duplicate_ids.add(room_data.room_id)
+            is_duplicate.append(duplicate)
+        
+        # Validate individual rooms, then summarise in batch order; the config
+        # is compiled once here, so edits made between batches are picked up
+        room_errors = self._room_errors(
+            [room_data for room_data, duplicate in zip(rooms_data, is_duplicate) if not duplicate],
+            _CompiledConfig.from_config(config)
+        )
+        for room_data, duplicate in zip(rooms_data, is_duplicate):
+            if duplicate:
                 summary.failed_rows += 1
-                error_msg = f"Duplicate room_id: {room_data.room_id}"
-                summary.validation_errors.append(error_msg)
-                summary.error_reasons["duplicate_room_id"] = summary.error_reasons.get("duplicate_room_id", 0) + 1
+                summary.record_error("duplicate_room_id", f"Duplicate room_id: {room_data.room_id}")
                 continue
             
-            room_ids.add(room_data.room_id)
-            
-            # Validate individual room
-            validation_result = self.validate_room_data(room_data, config)
-            
-            if validation_result.is_valid or (not self.strict_mode and not validation_result.errors):
+            errors = next(room_errors)
+            if not errors:
                 valid_rooms.append(room_data)
                 summary.successful_rows += 1
             else:
                 summary.failed_rows += 1
                 
                 # Collect error reasons for summary
-                for error in validation_result.errors:
-                    summary.validation_errors.append(f"{room_data.room_id}: {error.message}")
-                    error_category = error.field or "general"
-                    summary.error_reasons[error_category] = summary.error_reasons.get(error_category, 0) + 1
+                for field, message in errors:
+                    summary.record_error(field or "general", f"{room_data.room_id}: {message}")
         
         return valid_rooms, summary
+    
+    def _room_errors(self, rooms_data: List[ParsedRoomData],
+                     compiled: _CompiledConfig) -> Iterator[List[Tuple[str, str]]]:
+        """Yield each room's (field, message) errors, using worker processes for large batches."""
+        workers = self.max_workers or os.cpu_count() or 1
+        
+        # One contiguous slice per worker keeps results in batch order
+        chunk_size = max(1, -(-len(rooms_data) // workers))
+        chunks = [rooms_data[start:start + chunk_size] for start in range(0, len(rooms_data), chunk_size)]
+        
+        # A pool only pays for itself when several workers share a large batch
+        if len(rooms_data) < self.PARALLEL_THRESHOLD_ROOMS or workers <= 1 or len(chunks) <= 1:
+            return (
+                [(error.field, error.message) for error in self._validate_room(room_data, compiled).errors]
+                for room_data in rooms_data
+            )
+        
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                _validate_rooms_chunk, chunks, [compiled] * len(chunks), [self.strict_mode] * len(chunks)
+            ))
+        return chain.from_iterable(results)
+
+
+def _validate_rooms_chunk(rooms: List[ParsedRoomData], compiled: _CompiledConfig,
+                          strict_mode: bool) -> List[List[Tuple[str, str]]]:
+    """
+    Validate a contiguous slice of a batch in a worker process.
+    
+    Returns (field, message) pairs for each room's errors, in room order;
+    only errors decide batch success, so warnings are not sent back.
+    """
+    validator = RoomValidator(strict_mode=strict_mode)
+    return [
+        [(error.field, error.message) for error in validator._validate_room(room_data, compiled).errors]
+        for room_data in rooms
+    ]
 
 
 class ErrorReporter:
@@ -350,6 +511,8 @@ class ErrorReporter:
     - Batch summary: output/logs/summary.json
     """
     
+    MAX_WRITE_WORKERS = 8
+    
     def __init__(self, output_dir: Path):
         """Initialize error reporter with output directory."""
         self.output_dir = Path(output_dir)
@@ -361,7 +524,44 @@ class ErrorReporter:
         if not validation_result.errors and not validation_result.warnings:
             return  # No errors to report
         
-        error_report = {
+        error_file = self.logs_dir / f"{room_id}.errors.json"
+        _write_json(error_file, self._room_report(room_id, validation_result))
+    
+    def write_room_errors_batch(self, room_results: Iterable[Tuple[str, ValidationResult]]) -> None:
+        """
+        Write per-room error reports for a whole batch at once.
+        
+        Reports are built up front and the file writes fanned out over a
+        thread pool, so slow filesystems are not hit one room at a time.
+        Results sharing a room_id are merged into one report, so no two
+        threads ever write the same file.
+        
+        Args:
+            room_results: Pairs of (room_id, validation_result)
+        """
+        grouped: Dict[str, ValidationResult] = {}
+        for room_id, validation_result in room_results:
+            if validation_result.errors or validation_result.warnings:
+                combined = grouped.get(room_id)
+                if combined is None:
+                    combined = grouped[room_id] = ValidationResult(is_valid=True, errors=[], warnings=[])
+                combined.merge(validation_result)
+        
+        pending = [
+            (self.logs_dir / f"{room_id}.errors.json", self._room_report(room_id, validation_result))
+            for room_id, validation_result in grouped.items()
+        ]
+        if not pending:
+            return
+        
+        with ThreadPoolExecutor(max_workers=min(self.MAX_WRITE_WORKERS, len(pending))) as executor:
+            # Consume results so any write error is raised here
+            list(executor.map(lambda item: _write_json(*item), pending))
+    
+    @staticmethod
+    def _room_report(room_id: str, validation_result: ValidationResult) -> Dict[str, Any]:
+        """Build the JSON-serialisable report for one room."""
+        return {
             "room_id": room_id,
             "validation_status": "failed" if validation_result.errors else "warning",
             "errors": [
@@ -383,10 +583,6 @@ class ErrorReporter:
                 for warning in validation_result.warnings
             ]
         }
-        
-        error_file = self.logs_dir / f"{room_id}.errors.json"
-        with open(error_file, 'w', encoding='utf-8') as f:
-            json.dump(error_report, f, indent=2, default=str)
     
     def write_batch_summary(self, summary: BatchValidationSummary, 
                            input_file: str, config_file: str) -> None:
@@ -401,9 +597,8 @@ class ErrorReporter:
                 "success_rate": summary.successful_rows / summary.total_rows if summary.total_rows > 0 else 0.0
             },
             "error_breakdown": summary.error_reasons,
-            "validation_errors": summary.validation_errors[:50]  # Limit to first 50 errors
+            "validation_errors": summary.validation_errors[:summary.MAX_VALIDATION_ERRORS]
         }
         
         summary_file = self.logs_dir / "summary.json"
-        with open(summary_file, 'w', encoding='utf-8') as f:
-            json.dump(summary_report, f, indent=2, default=str)
\ No newline at end of file
+        _write_json(summary_file, summary_report)
\ No newline at end of file
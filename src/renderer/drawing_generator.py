@@ -5,13 +5,43 @@ This module takes LayoutResult objects from the layout engine and generates
 complete shop drawings using the PDF renderer, following memory bank specifications.
 """
 
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from pathlib import Path
+from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
 import datetime
+import os
 
 from ..core.interfaces import (
     IRenderer, LayoutResult, DrawingMetadata, RenderStyle, Point
 )
+from .pdf_renderer import PDFRenderer
+
+# (room_id, pdf_path, error) for one layout of a batch; exactly one of
+# pdf_path and error is set
+BatchDrawingResult = Tuple[str, Optional[str], Optional[str]]
+
+
+@dataclass(frozen=True)
+class _DrawingSettings:
+    """Drawing constants resolved once from a configuration dictionary."""
+    page_size: str
+    counter_height: float
+    base_depth: float
+    edge_rule: str
+    length_tolerance: float
+    
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "_DrawingSettings":
+        """Build drawing constants from a configuration dictionary."""
+        return cls(
+            page_size=config.get("PDF", {}).get("SIZE", "letter"),
+            counter_height=config.get("COUNTER_HEIGHT", 36.0),
+            base_depth=config.get("BASE_DEPTH", 24.0),
+            edge_rule=config.get("EDGE_RULE", "MATCH_FACE"),
+            length_tolerance=config.get("TOLERANCES", {}).get("LENGTH_SUM", 0.125)
+        )
 
 
 class ShopDrawingGenerator:
@@ -22,16 +52,37 @@ class ShopDrawingGenerator:
     following millwork industry standards from the memory banks.
     """
     
-    def __init__(self, renderer: IRenderer, config: Dict[str, Any]):
+    # Standard construction notes with their offsets below the notes title
+    _CONSTRUCTION_NOTES = tuple(
+        (12.0 + i * 8.0, note) for i, note in enumerate((
+            "1. All dimensions to be verified in field",
+            "2. Provide backing for all wall-mounted units",
+            "3. Coordinate with electrical and plumbing rough-in",
+            "4. Finish exposed edges to match face material",
+            "5. Install per manufacturer's recommendations"
+        ))
+    )
+    
+    # Batches at least this large are rendered in worker processes
+    PARALLEL_THRESHOLD_LAYOUTS = 200
+    
+    def __init__(self, renderer: IRenderer, config: Dict[str, Any],
+                 max_workers: Optional[int] = None, timestamp: Optional[str] = None):
         """
         Initialize drawing generator.
         
         Args:
             renderer: IRenderer implementation (e.g., PDFRenderer)
             config: Configuration dictionary with drawing parameters
+            max_workers: Worker processes for large batches (default: CPU count)
+            timestamp: ISO timestamp stamped on every drawing (default: now)
         """
         self.renderer = renderer
         self.config = config
+        self.max_workers = max_workers
+        self._settings = _DrawingSettings.from_config(config)
+        # One timestamp stamps every drawing produced by this generator
+        self._batch_timestamp = timestamp or datetime.datetime.now().isoformat()
         
     def generate_shop_drawing(self, layout: LayoutResult, 
                             output_dir: Path = Path("output/pdfs")) -> str:
@@ -49,7 +100,7 @@ class ShopDrawingGenerator:
         metadata = self._create_drawing_metadata(layout)
         
         # Initialize page
-        page_size = self.config.get("PDF", {}).get("SIZE", "letter")
+        page_size = self._settings.page_size
         output_path = str(output_dir / f"{layout.room_id}.pdf")
         self.renderer.begin_page(metadata, page_size, output_path)
         
@@ -64,12 +115,53 @@ class ShopDrawingGenerator:
         # Finalize page
         self.renderer.end_page()
         
-        # Save drawing
-        output_path = str(output_dir / f"{layout.room_id}.pdf")
+        # Save drawing to the path the page was opened on
         self.renderer.save(output_path)
         
         return output_path
         
+    def generate_batch(self, layouts: List[LayoutResult],
+                       output_dir: Path = Path("output/pdfs")) -> List[BatchDrawingResult]:
+        """
+        Generate shop drawings for many room layouts.
+        
+        Rooms share no state, so large batches of PDF layouts are split into
+        contiguous slices rendered by worker processes; ReportLab holds the
+        GIL, so threads would not help.
+        
+        Args:
+            layouts: Layouts from the layout engine
+            output_dir: Output directory for PDF files
+            
+        Returns:
+            (room_id, pdf_path, error) per layout, in input order; a layout
+            that failed to render has no path and the error message set
+        """
+        workers = self.max_workers or os.cpu_count() or 1
+        
+        # One contiguous slice per worker keeps results in batch order
+        chunk_size = max(1, -(-len(layouts) // workers))
+        chunks = [layouts[start:start + chunk_size] for start in range(0, len(layouts), chunk_size)]
+        
+        # A pool only pays for itself when several workers share a large PDF batch
+        if (len(layouts) < self.PARALLEL_THRESHOLD_LAYOUTS or workers <= 1 or len(chunks) <= 1
+                or not isinstance(self.renderer, PDFRenderer)):
+            return [self._generate_one(layout, output_dir) for layout in layouts]
+        
+        settings = (self.renderer.scale, self.renderer.margins, self.config, self._batch_timestamp)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(
+                _render_layouts_chunk, chunks, [output_dir] * len(chunks), [settings] * len(chunks)
+            ))
+        return list(chain.from_iterable(results))
+    
+    def _generate_one(self, layout: LayoutResult, output_dir: Path) -> BatchDrawingResult:
+        """Generate one drawing of a batch, capturing a failure as its message."""
+        try:
+            return layout.room_id, self.generate_shop_drawing(layout, output_dir), None
+        except Exception as e:
+            return layout.room_id, None, str(e)
+        
     def _create_drawing_metadata(self, layout: LayoutResult) -> DrawingMetadata:
         """Create drawing metadata from layout result."""
         return DrawingMetadata(
@@ -78,7 +170,7 @@ class ShopDrawingGenerator:
             spec_version="1.0",
             config_sha256=layout.metadata.config_sha256,
             csv_sha256="",  # Will be set by CLI
-            timestamp=datetime.datetime.now().isoformat(),
+            timestamp=self._batch_timestamp,
             drawing_id=f"MW-{layout.room_id}",
             submittal_number="01"
         )
@@ -89,13 +181,18 @@ class ShopDrawingGenerator:
         plan_origin_x = 24.0  # 2 feet from left margin
         plan_origin_y = 12.0  # 1 foot from bottom
         
-        # Draw base modules
+        # Bind renderer methods once for the per-module loops
+        draw_rect = self.renderer.draw_rect
+        draw_text = self.renderer.draw_text
+        
+        # Draw base modules; labels are drawn together after the outlines
+        module_labels = []
         for module in layout.modules:
             module_x = plan_origin_x + module.x
             module_y = plan_origin_y + module.y
             
             # Draw module rectangle
-            self.renderer.draw_rect(
+            draw_rect(
                 module_x, module_y, 
                 module.width, module.depth,
                 RenderStyle.MEDIUM_LINE
@@ -104,19 +201,18 @@ class ShopDrawingGenerator:
             # Add module number label
             label_x = module_x + module.width / 2
             label_y = module_y + module.depth / 2
-            self.renderer.draw_text(
-                label_x, label_y, 
-                f"M{module.index + 1}",
-                RenderStyle.TEXT_MEDIUM
-            )
+            module_labels.append((label_x, label_y, f"M{module.index + 1}"))
+        
+        self.renderer.draw_texts(module_labels, RenderStyle.TEXT_MEDIUM)
             
         # Draw fillers
+        filler_labels = []
         for filler in layout.fillers:
             filler_x = plan_origin_x + filler.x
             filler_y = plan_origin_y + filler.y
             
             # Draw filler rectangle with different style
-            self.renderer.draw_rect(
+            draw_rect(
                 filler_x, filler_y,
                 filler.width, filler.depth,
                 RenderStyle.THIN_LINE
@@ -125,11 +221,9 @@ class ShopDrawingGenerator:
             # Add filler label
             label_x = filler_x + filler.width / 2
             label_y = filler_y + filler.depth / 2
-            self.renderer.draw_text(
-                label_x, label_y,
-                f"F-{filler.side[0].upper()}",
-                RenderStyle.TEXT_SMALL
-            )
+            filler_labels.append((label_x, label_y, f"F-{filler.side[0].upper()}"))
+        
+        self.renderer.draw_texts(filler_labels, RenderStyle.TEXT_SMALL)
             
         # Draw countertop
         if layout.countertop:
@@ -140,7 +234,7 @@ class ShopDrawingGenerator:
             overhang = 1.0  # 1 inch overhang
             counter_y_offset = layout.countertop.y + layout.modules[0].depth - overhang
             
-            self.renderer.draw_rect(
+            draw_rect(
                 countertop_x, countertop_y + counter_y_offset,
                 layout.countertop.width, layout.countertop.depth,
                 RenderStyle.THICK_LINE
@@ -149,7 +243,7 @@ class ShopDrawingGenerator:
             # Add countertop material label
             label_x = countertop_x + layout.countertop.width / 2
             label_y = countertop_y + counter_y_offset + layout.countertop.depth / 2
-            self.renderer.draw_text(
+            draw_text(
                 label_x, label_y,
                 layout.countertop.material_code,
                 RenderStyle.TEXT_MEDIUM
@@ -162,40 +256,49 @@ class ShopDrawingGenerator:
         elev_origin_y = 12.0   # Same as plan view
         
         # Get configuration values
-        counter_height = self.config.get("COUNTER_HEIGHT", 36.0)
-        base_depth = self.config.get("BASE_DEPTH", 24.0)
+        counter_height = self._settings.counter_height
+        base_depth = self._settings.base_depth
+        
+        # Module-independent elevation geometry
+        toe_kick_height = 4.0  # 4 inch toe kick
+        door_margin = 2.0  # 2 inch margin for doors
+        door_y = elev_origin_y + toe_kick_height + door_margin
+        door_height = counter_height - toe_kick_height - 2 * door_margin
+        
+        # Bind renderer methods once for the per-module loops
+        draw_rect = self.renderer.draw_rect
         
         # Draw base cabinets in elevation
         for module in layout.modules:
-            module_x = elev_origin_x + module.x
-            
-            # Draw base cabinet
-            self.renderer.draw_rect(
-                module_x, elev_origin_y,
+            draw_rect(
+                elev_origin_x + module.x, elev_origin_y,
                 module.width, counter_height,
                 RenderStyle.MEDIUM_LINE
             )
+        
+        # Toe kicks and doors go in a second pass so their thin-line
+        # strokes are batched into one path instead of alternating styles
+        for module in layout.modules:
+            module_x = elev_origin_x + module.x
             
             # Draw toe kick
-            toe_kick_height = 4.0  # 4 inch toe kick
-            self.renderer.draw_rect(
+            draw_rect(
                 module_x, elev_origin_y,
                 module.width, toe_kick_height,
                 RenderStyle.THIN_LINE
             )
             
             # Add door/drawer representation
-            door_margin = 2.0  # 2 inch margin for doors
-            self.renderer.draw_rect(
-                module_x + door_margin, elev_origin_y + toe_kick_height + door_margin,
-                module.width - 2 * door_margin, counter_height - toe_kick_height - 2 * door_margin,
+            draw_rect(
+                module_x + door_margin, door_y,
+                module.width - 2 * door_margin, door_height,
                 RenderStyle.THIN_LINE
             )
         
         # Draw countertop in elevation
         if layout.countertop:
             countertop_thickness = 1.5  # 1.5 inch thick countertop
-            self.renderer.draw_rect(
+            draw_rect(
                 elev_origin_x, elev_origin_y + counter_height,
                 layout.total_width, countertop_thickness,
                 RenderStyle.THICK_LINE
@@ -206,9 +309,12 @@ class ShopDrawingGenerator:
         plan_origin_x = 24.0
         plan_origin_y = 12.0
         
+        # Bind renderer methods once for the per-module loops
+        draw_dimension = self.renderer.draw_dimension
+        
         # Overall dimension
         overall_y = plan_origin_y - 6.0  # 6 inches below plan
-        self.renderer.draw_dimension(
+        draw_dimension(
             plan_origin_x, 
             plan_origin_x + layout.total_width,
             overall_y,
@@ -221,7 +327,7 @@ class ShopDrawingGenerator:
         
         for module in layout.modules:
             module_end_x = current_x + module.width
-            self.renderer.draw_dimension(
+            draw_dimension(
                 current_x,
                 module_end_x,
                 module_y,
@@ -232,7 +338,7 @@ class ShopDrawingGenerator:
         # Add filler dimensions if present
         for filler in layout.fillers:
             filler_x = plan_origin_x + filler.x
-            self.renderer.draw_dimension(
+            draw_dimension(
                 filler_x,
                 filler_x + filler.width,
                 module_y - 6.0,  # 6 inches below module dimensions
@@ -268,7 +374,7 @@ class ShopDrawingGenerator:
             )
         
         # Edge treatment
-        edge_rule = self.config.get("EDGE_RULE", "MATCH_FACE")
+        edge_rule = self._settings.edge_rule
         self.renderer.draw_text(
             schedule_x, schedule_y - 36.0,
             f"Edge Treatment: {edge_rule}",
@@ -348,25 +454,29 @@ class ShopDrawingGenerator:
         )
         
         # Standard construction notes
-        notes = [
-            "1. All dimensions to be verified in field",
-            "2. Provide backing for all wall-mounted units",
-            "3. Coordinate with electrical and plumbing rough-in",
-            "4. Finish exposed edges to match face material",
-            "5. Install per manufacturer's recommendations"
-        ]
-        
-        for i, note in enumerate(notes):
-            self.renderer.draw_text(
-                notes_x, notes_y - 12.0 - (i * 8.0),
-                note,
-                RenderStyle.TEXT_SMALL
-            )
+        self.renderer.draw_texts(
+            [(notes_x, notes_y - offset, note) for offset, note in self._CONSTRUCTION_NOTES],
+            RenderStyle.TEXT_SMALL
+        )
         
         # Tolerance note
-        tolerance = self.config.get("TOLERANCES", {}).get("LENGTH_SUM", 0.125)
+        tolerance = self._settings.length_tolerance
         self.renderer.draw_text(
             notes_x, notes_y - 60.0,
             f"Fabrication tolerance: ±{tolerance}\"",
             RenderStyle.TEXT_SMALL
-        )
\ No newline at end of file
+        )
+
+
+def _render_layouts_chunk(layouts: List[LayoutResult], output_dir: Path,
+                          settings: Tuple[float, List[float], Dict[str, Any], str]
+                          ) -> List[BatchDrawingResult]:
+    """
+    Render a contiguous slice of a batch in a worker process.
+    
+    settings carries the parent's renderer scale and margins, configuration
+    and batch timestamp, so every sheet in the batch matches.
+    """
+    scale, margins, config, timestamp = settings
+    generator = ShopDrawingGenerator(PDFRenderer(scale=scale, margins=margins), config, timestamp=timestamp)
+    return [generator._generate_one(layout, output_dir) for layout in layouts]
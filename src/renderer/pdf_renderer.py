@@ -5,21 +5,39 @@ This module implements the IRenderer interface using ReportLab to generate
 professional-quality vector PDFs for millwork shop drawings.
 """
 
-from typing import List, Dict, Any, Optional, Tuple
+from typing import List, Dict, Any, Optional, Set, Tuple
 from pathlib import Path
 import math
 
 from reportlab.pdfgen import canvas
+from reportlab.pdfgen.pathobject import PDFPathObject
 from reportlab.lib.pagesizes import letter, A4, A3, TABLOID
 from reportlab.lib import colors
 from reportlab.lib.units import inch
-from reportlab.pdfbase import pdfutils
-from reportlab.platypus import Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
 
 from ..core.interfaces import IRenderer, RenderStyle, Point, DrawingMetadata
 
 
+def _line_style_table(definitions: Dict[RenderStyle, Dict[str, Any]]
+                      ) -> Dict[RenderStyle, Tuple[float, Any, List[float]]]:
+    """Flatten line style definitions to (line_width, color, dash_pattern) tuples."""
+    return {
+        style: (style_def["line_width"], style_def["color"], style_def.get("dash_pattern") or [])
+        for style, style_def in definitions.items()
+        if "line_width" in style_def
+    }
+
+
+def _text_style_table(definitions: Dict[RenderStyle, Dict[str, Any]]
+                      ) -> Dict[RenderStyle, Tuple[str, float, Any]]:
+    """Flatten text style definitions to (font_name, font_size, color) tuples."""
+    return {
+        style: (style_def["font_name"], style_def["font_size"], style_def["color"])
+        for style, style_def in definitions.items()
+        if "font_name" in style_def
+    }
+
+
 class PDFRenderer(IRenderer):
     """
     ReportLab-based PDF renderer implementing the IRenderer interface.
@@ -97,6 +115,10 @@ class PDFRenderer(IRenderer):
         }
     }
     
+    # STYLE_DEFINITIONS resolved once into tuples for applying styles
+    _LINE_STYLES = _line_style_table(STYLE_DEFINITIONS)
+    _TEXT_STYLES = _text_style_table(STYLE_DEFINITIONS)
+    
     def __init__(self, scale: float = 0.25, margins: Optional[List[float]] = None):
         """
         Initialize PDF renderer.
@@ -112,8 +134,20 @@ class PDFRenderer(IRenderer):
         self.page_height = 0.0
         self.drawing_origin_x = 0.0
         self.drawing_origin_y = 0.0
+        self._scale_inch = inch * scale  # Points per drawing inch
+        # Page geometry in points, computed once per page by begin_page
+        self._title_block_rect = (0.0, 0.0, 0.0, 0.0)
+        self._border_rect = (0.0, 0.0, 0.0, 0.0)
+        # Output directories already created by this renderer
+        self._ensured_dirs: Set[Path] = set()
         self.current_metadata: Optional[DrawingMetadata] = None
         self.current_output_path: Optional[str] = None
+        # Consecutive stroke-only primitives of one style share a single path
+        self._pending_path: Optional[PDFPathObject] = None
+        self._pending_style: Optional[RenderStyle] = None
+        # Styles last applied to the canvas, so repeats can be skipped
+        self._current_line_style: Optional[RenderStyle] = None
+        self._current_text_style: Optional[RenderStyle] = None
         
     def begin_page(self, metadata: DrawingMetadata, page_size: str = "letter", output_path: str = None) -> None:
         """Initialize a new drawing page with metadata."""
@@ -121,8 +155,11 @@ class PDFRenderer(IRenderer):
         if output_path is None:
             output_path = f"output/pdfs/{metadata.room_id}.pdf"
         
-        # Create output directory if it doesn't exist
-        Path(output_path).parent.mkdir(parents=True, exist_ok=True)
+        # Create output directory if it doesn't exist (once per directory)
+        output_dir = Path(output_path).parent
+        if output_dir not in self._ensured_dirs:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(output_dir)
         
         # Get page dimensions
         if page_size.lower() not in self.PAGE_SIZES:
@@ -133,12 +170,18 @@ class PDFRenderer(IRenderer):
         
         # Initialize canvas
         self.canvas = canvas.Canvas(output_path, pagesize=page_dimensions)
+        self._pending_path = None
+        self._pending_style = None
+        self._current_line_style = None
+        self._current_text_style = None
         self.current_metadata = metadata
         self.current_output_path = output_path
         
         # Calculate drawing area origin (bottom-left of drawing area)
         self.drawing_origin_x = self.margins[0] * inch
         self.drawing_origin_y = self.margins[1] * inch
+        self._scale_inch = inch * self.scale
+        self._compute_page_geometry()
         
         # Set up PDF metadata
         self._setup_pdf_metadata()
@@ -153,16 +196,17 @@ class PDFRenderer(IRenderer):
         if not self.canvas:
             raise RuntimeError("Canvas not initialized. Call begin_page() first.")
         
-        # Apply coordinate transformation
-        pdf_x, pdf_y = self._transform_coordinates(x, y)
-        pdf_width = width * inch * self.scale
-        pdf_height = height * inch * self.scale
+        # Reuse the pending path directly when the style matches
+        path = self._pending_path
+        if path is None or style is not self._pending_style:
+            path = self._stroke_path(style)
         
-        # Apply style
-        self._apply_line_style(style)
-        
-        # Draw rectangle
-        self.canvas.rect(pdf_x, pdf_y, pdf_width, pdf_height, stroke=1, fill=0)
+        # Apply coordinate transformation inline
+        scale_inch = self._scale_inch
+        path.rect(
+            self.drawing_origin_x + x * scale_inch, self.drawing_origin_y + y * scale_inch,
+            width * scale_inch, height * scale_inch
+        )
         
     def draw_line(self, x1: float, y1: float, x2: float, y2: float,
                   style: RenderStyle = RenderStyle.THIN_LINE) -> None:
@@ -174,11 +218,10 @@ class PDFRenderer(IRenderer):
         pdf_x1, pdf_y1 = self._transform_coordinates(x1, y1)
         pdf_x2, pdf_y2 = self._transform_coordinates(x2, y2)
         
-        # Apply style
-        self._apply_line_style(style)
-        
-        # Draw line
-        self.canvas.line(pdf_x1, pdf_y1, pdf_x2, pdf_y2)
+        # Add line to the pending path for this style
+        path = self._stroke_path(style)
+        path.moveTo(pdf_x1, pdf_y1)
+        path.lineTo(pdf_x2, pdf_y2)
         
     def draw_text(self, x: float, y: float, text: str, 
                   style: RenderStyle = RenderStyle.TEXT_MEDIUM,
@@ -190,18 +233,64 @@ class PDFRenderer(IRenderer):
         # Apply coordinate transformation
         pdf_x, pdf_y = self._transform_coordinates(x, y)
         
+        # Keep text above any linework drawn before it
+        self._flush_path()
+        
         # Apply text style
         self._apply_text_style(style)
         
         # Handle rotation
+        c = self.canvas
+        if rotation != 0.0:
+            c.saveState()
+            c.translate(pdf_x, pdf_y)
+            c.rotate(rotation)
+            c.drawString(0, 0, text)
+            c.restoreState()
+            self._current_line_style = None
+            self._current_text_style = None
+        else:
+            c.drawString(pdf_x, pdf_y, text)
+    
+    def draw_texts(self, texts: List[Tuple[float, float, str]],
+                   style: RenderStyle = RenderStyle.TEXT_MEDIUM,
+                   rotation: float = 0.0) -> None:
+        """
+        Draw several labels sharing one style and rotation.
+        
+        The labels go out as a single PDF text object, with style applied
+        once and rotation carried in each label's text matrix instead of a
+        saveState/rotate/restoreState round trip per label.
+        
+        Args:
+            texts: (x, y, text) labels in drawing coordinates
+            style: Text style for every label
+            rotation: Rotation in degrees for every label
+        """
+        if not self.canvas:
+            raise RuntimeError("Canvas not initialized. Call begin_page() first.")
+        
+        if not texts:
+            return
+        
+        # Keep text above any linework drawn before it
+        self._flush_path()
+        self._apply_text_style(style)
+        
+        text_object = self.canvas.beginText()
+        transform = self._transform_coordinates
         if rotation != 0.0:
-            self.canvas.saveState()
-            self.canvas.translate(pdf_x, pdf_y)
-            self.canvas.rotate(rotation)
-            self.canvas.drawString(0, 0, text)
-            self.canvas.restoreState()
+            radians = math.radians(rotation)
+            cos_r, sin_r = math.cos(radians), math.sin(radians)
+            for x, y, text in texts:
+                pdf_x, pdf_y = transform(x, y)
+                text_object.setTextTransform(cos_r, sin_r, -sin_r, cos_r, pdf_x, pdf_y)
+                text_object.textOut(text)
         else:
-            self.canvas.drawString(pdf_x, pdf_y, text)
+            for x, y, text in texts:
+                text_object.setTextOrigin(*transform(x, y))
+                text_object.textOut(text)
+        self.canvas.drawText(text_object)
     
     def draw_dimension(self, x1: float, x2: float, y_base: float, 
                       dimension_text: str,
@@ -214,13 +303,19 @@ class PDFRenderer(IRenderer):
         offset = 6.0  # 6 inches above the base line
         arrow_size = 1.0  # 1 inch arrow size
         
-        # Draw extension lines
-        self.draw_line(x1, y_base, x1, y_base + offset, style)
-        self.draw_line(x2, y_base, x2, y_base + offset, style)
-        
-        # Draw dimension line
+        # Transform the endpoints shared by the extension and dimension lines
         dim_y = y_base + offset
-        self.draw_line(x1, dim_y, x2, dim_y, style)
+        pdf_x1, pdf_base_y = self._transform_coordinates(x1, y_base)
+        pdf_x2, pdf_dim_y = self._transform_coordinates(x2, dim_y)
+        
+        # Draw extension lines and dimension line as one path
+        path = self._stroke_path(style)
+        path.moveTo(pdf_x1, pdf_base_y)
+        path.lineTo(pdf_x1, pdf_dim_y)
+        path.moveTo(pdf_x2, pdf_base_y)
+        path.lineTo(pdf_x2, pdf_dim_y)
+        path.moveTo(pdf_x1, pdf_dim_y)
+        path.lineTo(pdf_x2, pdf_dim_y)
         
         # Draw arrows
         self._draw_dimension_arrow(x1, dim_y, arrow_size, True)
@@ -241,38 +336,42 @@ class PDFRenderer(IRenderer):
         if len(points) < 2:
             return
         
-        # Apply style
-        self._apply_line_style(style)
+        # Continue the pending path for this style
+        path = self._stroke_path(style)
         
-        # Create path
-        path = self.canvas.beginPath()
+        # Transform inline; the origin and scale are fixed for the whole polyline
+        origin_x = self.drawing_origin_x
+        origin_y = self.drawing_origin_y
+        scale_inch = self._scale_inch
         
-        # Start at first point
-        first_point = self._transform_coordinates(points[0].x, points[0].y)
-        path.moveTo(*first_point)
+        # Start at first point, then add lines to subsequent points
+        point_iter = iter(points)
+        first_point = next(point_iter)
+        path.moveTo(origin_x + first_point.x * scale_inch, origin_y + first_point.y * scale_inch)
         
-        # Add lines to subsequent points
-        for point in points[1:]:
-            pdf_point = self._transform_coordinates(point.x, point.y)
-            path.lineTo(*pdf_point)
+        line_to = path.lineTo
+        for point in point_iter:
+            line_to(origin_x + point.x * scale_inch, origin_y + point.y * scale_inch)
         
         # Close path if requested
         if closed:
             path.close()
-        
-        # Draw path
-        self.canvas.drawPath(path, stroke=1, fill=0)
     
     def end_page(self) -> None:
         """Finalize the current page."""
         if self.canvas:
+            self._flush_path()
             self.canvas.showPage()
+            # A new page starts from the default graphics state
+            self._current_line_style = None
+            self._current_text_style = None
     
     def save(self, output_path: str) -> None:
         """Save the drawing to the specified file path."""
         if not self.canvas:
             raise RuntimeError("Canvas not initialized. Call begin_page() first.")
         
+        self._flush_path()
         self.canvas.save()
         
     # Private helper methods
@@ -298,81 +397,116 @@ class PDFRenderer(IRenderer):
         if not self.canvas or not self.current_metadata:
             return
         
-        # Title block dimensions (bottom-right corner)
-        title_width = 4.0 * inch
-        title_height = 2.0 * inch
-        title_x = self.page_width - self.margins[2] * inch - title_width
-        title_y = self.margins[1] * inch
+        title_x, title_y, title_width, title_height = self._title_block_rect
         
         # Draw title block border
         self.canvas.setLineWidth(0.5)
         self.canvas.rect(title_x, title_y, title_width, title_height, stroke=1, fill=0)
         
-        # Add title block text
-        self.canvas.setFont("Helvetica-Bold", 12)
-        self.canvas.drawString(title_x + 6, title_y + title_height - 20, 
-                              f"MILLWORK SHOP DRAWING")
-        
-        self.canvas.setFont("Helvetica", 10)
-        self.canvas.drawString(title_x + 6, title_y + title_height - 40, 
-                              f"Room: {self.current_metadata.room_id}")
-        self.canvas.drawString(title_x + 6, title_y + title_height - 55, 
-                              f"Date: {self.current_metadata.timestamp[:10]}")
-        self.canvas.drawString(title_x + 6, title_y + title_height - 70, 
-                              f"Scale: {self.scale}\" = 1'")
+        # Add title block text as a single text object
+        text_x = title_x + 6
+        text_top = title_y + title_height
+        text = self.canvas.beginText()
+        text.setFont("Helvetica-Bold", 12)
+        text.setTextOrigin(text_x, text_top - 20)
+        text.textOut("MILLWORK SHOP DRAWING")
+        
+        text.setFont("Helvetica", 10)
+        text.setTextOrigin(text_x, text_top - 40)
+        text.textOut(f"Room: {self.current_metadata.room_id}")
+        text.setTextOrigin(text_x, text_top - 55)
+        text.textOut(f"Date: {self.current_metadata.timestamp[:10]}")
+        text.setTextOrigin(text_x, text_top - 70)
+        text.textOut(f"Scale: {self.scale}\" = 1'")
         
         if self.current_metadata.drawing_id:
-            self.canvas.drawString(title_x + 6, title_y + title_height - 85,
-                                  f"Drawing: {self.current_metadata.drawing_id}")
+            text.setTextOrigin(text_x, text_top - 85)
+            text.textOut(f"Drawing: {self.current_metadata.drawing_id}")
+        
+        self.canvas.drawText(text)
         
     def _draw_page_border(self) -> None:
         """Draw page border around drawing area."""
         if not self.canvas:
             return
         
-        # Calculate border coordinates
-        border_x = self.margins[0] * inch
-        border_y = self.margins[1] * inch
-        border_width = self.page_width - (self.margins[0] + self.margins[2]) * inch
-        border_height = self.page_height - (self.margins[1] + self.margins[3]) * inch
-        
         # Draw border
         self.canvas.setLineWidth(1.0)
         self.canvas.setStrokeColor(colors.black)
-        self.canvas.rect(border_x, border_y, border_width, border_height, 
-                        stroke=1, fill=0)
+        self.canvas.rect(*self._border_rect, stroke=1, fill=0)
+        
+    def _compute_page_geometry(self) -> None:
+        """Compute the title block and border rectangles for the current page size."""
+        margin_left, margin_bottom, margin_right, margin_top = self.margins
         
+        # Title block dimensions (bottom-right corner)
+        title_width = 4.0 * inch
+        title_height = 2.0 * inch
+        self._title_block_rect = (
+            self.page_width - margin_right * inch - title_width, margin_bottom * inch,
+            title_width, title_height
+        )
+        
+        # Border around the drawing area
+        self._border_rect = (
+            margin_left * inch, margin_bottom * inch,
+            self.page_width - (margin_left + margin_right) * inch,
+            self.page_height - (margin_bottom + margin_top) * inch
+        )
+        
+    def _stroke_path(self, style: RenderStyle) -> PDFPathObject:
+        """Return the pending stroke path for style, flushing one of another style first."""
+        if not self.canvas:
+            raise RuntimeError("Canvas not initialized. Call begin_page() first.")
+        if self._pending_path is not None and style is not self._pending_style:
+            self._flush_path()
+        if self._pending_path is None:
+            self._pending_path = self.canvas.beginPath()
+            self._pending_style = style
+        return self._pending_path
+    
+    def _flush_path(self) -> None:
+        """Stroke the pending path, applying its line style once."""
+        if self._pending_path is None or self._pending_style is None or not self.canvas:
+            return
+        
+        self._apply_line_style(self._pending_style)
+        self.canvas.drawPath(self._pending_path, stroke=1, fill=0)
+        self._pending_path = None
+        self._pending_style = None
+    
     def _transform_coordinates(self, x: float, y: float) -> Tuple[float, float]:
         """Transform drawing coordinates to PDF coordinates."""
-        pdf_x = self.drawing_origin_x + (x * inch * self.scale)
-        pdf_y = self.drawing_origin_y + (y * inch * self.scale)
-        return pdf_x, pdf_y
+        scale_inch = self._scale_inch
+        return self.drawing_origin_x + x * scale_inch, self.drawing_origin_y + y * scale_inch
         
     def _apply_line_style(self, style: RenderStyle) -> None:
         """Apply line style to canvas."""
-        if not self.canvas:
+        if not self.canvas or style is self._current_line_style:
             return
+        self._current_line_style = style
         
-        style_def = self.STYLE_DEFINITIONS.get(style, self.STYLE_DEFINITIONS[RenderStyle.THIN_LINE])
-        
-        self.canvas.setLineWidth(style_def["line_width"])
-        self.canvas.setStrokeColor(style_def["color"])
+        line_width, color, dash_pattern = self._LINE_STYLES.get(
+            style, self._LINE_STYLES[RenderStyle.THIN_LINE]
+        )
         
-        # Apply dash pattern if specified
-        if style_def.get("dash_pattern"):
-            self.canvas.setDash(style_def["dash_pattern"])
-        else:
-            self.canvas.setDash([])  # Solid line
+        c = self.canvas
+        c.setLineWidth(line_width)
+        c.setStrokeColor(color)
+        c.setDash(dash_pattern)  # Empty pattern is a solid line
             
     def _apply_text_style(self, style: RenderStyle) -> None:
         """Apply text style to canvas."""
-        if not self.canvas:
+        if not self.canvas or style is self._current_text_style:
             return
+        self._current_text_style = style
         
-        style_def = self.STYLE_DEFINITIONS.get(style, self.STYLE_DEFINITIONS[RenderStyle.TEXT_MEDIUM])
+        font_name, font_size, color = self._TEXT_STYLES.get(
+            style, self._TEXT_STYLES[RenderStyle.TEXT_MEDIUM]
+        )
         
-        self.canvas.setFont(style_def["font_name"], style_def["font_size"])
-        self.canvas.setFillColor(style_def["color"])
+        self.canvas.setFont(font_name, font_size)
+        self.canvas.setFillColor(color)
         
     def _draw_dimension_arrow(self, x: float, y: float, size: float, pointing_right: bool) -> None:
         """Draw a dimension arrow."""
@@ -380,19 +514,20 @@ class PDFRenderer(IRenderer):
             return
         
         pdf_x, pdf_y = self._transform_coordinates(x, y)
-        arrow_size = size * self.scale * inch
+        arrow_size = size * self._scale_inch
+        
+        # Arrow base corners, behind the tip in the pointing direction
+        base_x = pdf_x - arrow_size if pointing_right else pdf_x + arrow_size
+        half_width = arrow_size / 3
+        
+        # Filled shapes are drawn on their own, after pending linework
+        self._flush_path()
         
         # Create arrow path
         path = self.canvas.beginPath()
         path.moveTo(pdf_x, pdf_y)
-        
-        if pointing_right:
-            path.lineTo(pdf_x - arrow_size, pdf_y + arrow_size/3)
-            path.lineTo(pdf_x - arrow_size, pdf_y - arrow_size/3)
-        else:
-            path.lineTo(pdf_x + arrow_size, pdf_y + arrow_size/3)
-            path.lineTo(pdf_x + arrow_size, pdf_y - arrow_size/3)
-        
+        path.lineTo(base_x, pdf_y + half_width)
+        path.lineTo(base_x, pdf_y - half_width)
         path.close()
         
         # Draw filled arrow
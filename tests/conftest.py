@@ -4,70 +4,69 @@ Test configuration module for Millwork Drafter tests.
 Provides test fixtures, mock data, and common test utilities.
 """
 
+import copy
 import pytest
-import tempfile
 import yaml
 from pathlib import Path
 from typing import Dict, Any
 
 from src.core.config import MillworkConfig, ConfigLoader
 
+# libyaml-backed safe loader when available
+CLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+# Canonical sample configuration, written verbatim by temp_config_file
+SAMPLE_CONFIG_YAML = b"""\
+SCALE_PLAN: 0.25
+COUNTER_HEIGHT: 36.0
+BASE_DEPTH: 24.0
+WALL_CAB_DEPTH: 12.0
+EDGE_RULE: MATCH_FACE
+ADA:
+  KNEE_CLEAR: '27" H x 30" W x 17" D'
+  TOE_CLEAR: '9" H x 6" D'
+  COUNTER_RANGE: [28.0, 34.0]
+  CLEAR_WIDTHS: 32.0
+TOLERANCES:
+  LENGTH_SUM: 0.125
+  LENGTH_ROUNDING: 2
+PDF:
+  SIZE: letter
+  MARGINS: [0.5, 0.5, 0.5, 0.5]
+HW:
+  DEFAULTS:
+    HINGE: BLUM-110
+    PULL: SS-128
+    SLIDE: BLUM-563
+CODE:
+  BASIS: ADA 2010
+SCHEDULE:
+  FORMAT: on-sheet
+CAD:
+  DELIVERABLES: false
+EDGE_RULES: [MATCH_FACE, PVC_EDGE, SOLID_LUMBER, RADIUS]
+"""
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def sample_config_dict() -> Dict[str, Any]:
-    """Sample configuration dictionary for testing."""
-    return {
-        "SCALE_PLAN": 0.25,
-        "COUNTER_HEIGHT": 36.0,
-        "BASE_DEPTH": 24.0,
-        "WALL_CAB_DEPTH": 12.0,
-        "EDGE_RULE": "MATCH_FACE",
-        "ADA": {
-            "KNEE_CLEAR": "27\" H x 30\" W x 17\" D",
-            "TOE_CLEAR": "9\" H x 6\" D",
-            "COUNTER_RANGE": [28.0, 34.0],
-            "CLEAR_WIDTHS": 32.0,
-        },
-        "TOLERANCES": {
-            "LENGTH_SUM": 0.125,
-            "LENGTH_ROUNDING": 2,
-        },
-        "PDF": {
-            "SIZE": "letter",
-            "MARGINS": [0.5, 0.5, 0.5, 0.5],
-        },
-        "HW": {
-            "DEFAULTS": {
-                "HINGE": "BLUM-110",
-                "PULL": "SS-128",
-                "SLIDE": "BLUM-563",
-            }
-        },
-        "CODE": {
-            "BASIS": "ADA 2010",
-        },
-        "SCHEDULE": {
-            "FORMAT": "on-sheet",
-        },
-        "CAD": {
-            "DELIVERABLES": False,
-        },
-        "EDGE_RULES": ["MATCH_FACE", "PVC_EDGE", "SOLID_LUMBER", "RADIUS"],
-    }
+    """Sample configuration dictionary for testing (shared; copy before mutating)."""
+    return yaml.load(SAMPLE_CONFIG_YAML, Loader=CLoader)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_millwork_config() -> MillworkConfig:
     """Sample MillworkConfig object for testing."""
     return MillworkConfig()
 
 
-@pytest.fixture
-def temp_config_file(sample_config_dict) -> Path:
+@pytest.fixture(scope="session")
+def temp_config_file(tmp_path_factory) -> Path:
     """Create a temporary config file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-        yaml.dump(sample_config_dict, f)
-        return Path(f.name)
+    config_file = tmp_path_factory.mktemp("config") / "config.yaml"
+    config_file.write_bytes(SAMPLE_CONFIG_YAML)
+    return config_file
 
 
 @pytest.fixture
@@ -76,7 +75,27 @@ def config_loader() -> ConfigLoader:
     return ConfigLoader()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def sample_config_hash(sample_config_dict) -> str:
+    """SHA-256 hash of the sample configuration, computed once per session."""
+    return ConfigLoader().get_config_hash(sample_config_dict)
+
+
+@pytest.fixture(scope="session")
+def modified_config_dict(sample_config_dict) -> Dict[str, Any]:
+    """Sample configuration with a different plan scale."""
+    modified_config = copy.deepcopy(sample_config_dict)
+    modified_config["SCALE_PLAN"] = 0.5
+    return modified_config
+
+
+@pytest.fixture(scope="session")
+def modified_config_hash(modified_config_dict) -> str:
+    """SHA-256 hash of the modified sample configuration."""
+    return ConfigLoader().get_config_hash(modified_config_dict)
+
+
+@pytest.fixture(scope="session")
 def sample_csv_data() -> str:
     """Sample CSV data for testing."""
     return """room_id,total_length_in,num_modules,module_widths,material_top,material_casework,left_filler_in,right_filler_in,has_sink,counter_height_in
@@ -84,15 +103,15 @@ KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT,0.0,0.0,true,36.0
 BATH-01,72.0,2,"[36,36]",LAM-01,PLM-WHT,0.0,0.0,false,34.0"""
 
 
-@pytest.fixture
-def temp_csv_file(sample_csv_data) -> Path:
+@pytest.fixture(scope="session")
+def temp_csv_file(sample_csv_data, tmp_path_factory) -> Path:
     """Create a temporary CSV file for testing."""
-    with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False) as f:
-        f.write(sample_csv_data)
-        return Path(f.name)
+    csv_file = tmp_path_factory.mktemp("csv") / "rooms.csv"
+    csv_file.write_bytes(sample_csv_data.encode("utf-8"))
+    return csv_file
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_room_data() -> Dict[str, Any]:
     """Sample room data dictionary for testing."""
     return {
@@ -6,13 +6,20 @@ as specified in Phase 1 of the development plan.
 """
 
 import pytest
-import tempfile
 import yaml
-from pathlib import Path
 
 from src.core.config import MillworkConfig, ConfigLoader, load_default_config
 from src.core.interfaces import ValidationResult
 
+# libyaml-backed safe dumper/loader when available
+CDumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+CLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def error_fields(result: ValidationResult) -> set:
+    """Return the set of fields a validation result reported errors for."""
+    return {err.field for err in result.errors}
+
 
 class TestMillworkConfig:
     """Test the MillworkConfig dataclass."""
@@ -81,11 +88,10 @@ class TestConfigLoader:
         with pytest.raises(ValueError, match="Error loading configuration"):
             config_loader.load_config("nonexistent.yaml")
     
-    def test_load_invalid_yaml(self, config_loader):
+    def test_load_invalid_yaml(self, config_loader, tmp_path):
         """Test loading invalid YAML content."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("invalid: yaml: content: [")
-            invalid_file = Path(f.name)
+        invalid_file = tmp_path / "invalid.yaml"
+        invalid_file.write_bytes(b"invalid: yaml: content: [")
         
         with pytest.raises(ValueError, match="Invalid YAML"):
             config_loader.load_config(str(invalid_file))
@@ -106,62 +112,53 @@ class TestConfigLoader:
         assert len(result.errors) == 1
         assert result.errors[0].field == "SCALE_PLAN"
     
-    def test_validate_invalid_ada_range(self, config_loader):
-        """Test validation with invalid ADA counter range."""
-        invalid_config = {
-            "ADA": {
-                "COUNTER_RANGE": [34.0, 28.0]  # min > max
-            }
-        }
+    @pytest.mark.parametrize("invalid_config, field", [
+        ({"ADA": {"COUNTER_RANGE": [34.0, 28.0]}}, "ADA.COUNTER_RANGE"),  # min > max
+        ({"ADA": {"COUNTER_RANGE": [35.0, 30.0]}}, "ADA.COUNTER_RANGE"),
+        ({"ADA": {"COUNTER_RANGE": "not_a_list"}}, "ADA.COUNTER_RANGE"),
+        ({"ADA": {"COUNTER_RANGE": [28.0, 34.0, 36.0]}}, "ADA.COUNTER_RANGE"),  # 3 elements instead of 2
+        ({"ADA": {"COUNTER_RANGE": ["28.0", 34.0]}}, "ADA.COUNTER_RANGE"),  # String instead of number
+        ({"PDF": {"SIZE": "invalid_size"}}, "PDF.SIZE"),
+        ({"PDF": {"MARGINS": [0.5, 0.5]}}, "PDF.MARGINS"),  # Only 2 values instead of 4
+        ({"PDF": {"MARGINS": [0.5, -0.5, 0.5, 0.5]}}, "PDF.MARGINS"),  # Negative margin
+        ({"COUNTER_HEIGHT": -10.0}, "COUNTER_HEIGHT"),
+        ({"COUNTER_HEIGHT": "not_a_number"}, "COUNTER_HEIGHT"),
+        ({"BASE_DEPTH": -5.0}, "BASE_DEPTH"),
+        ({"BASE_DEPTH": "invalid"}, "BASE_DEPTH"),
+        ({"WALL_CAB_DEPTH": 0}, "WALL_CAB_DEPTH"),
+        ({"WALL_CAB_DEPTH": "invalid"}, "WALL_CAB_DEPTH"),
+        ({"TOLERANCES": {"LENGTH_SUM": -0.5}}, "TOLERANCES.LENGTH_SUM"),
+        ({"TOLERANCES": {"LENGTH_ROUNDING": -1}}, "TOLERANCES.LENGTH_ROUNDING"),
+        ({"TOLERANCES": {"LENGTH_ROUNDING": 2.5}}, "TOLERANCES.LENGTH_ROUNDING"),  # Float instead of int
+        ({"EDGE_RULES": "not_a_list"}, "EDGE_RULES"),
+        ({"EDGE_RULES": ["MATCH_FACE", 123, "EDGE_BAND"]}, "EDGE_RULES"),  # Number in list
+    ])
+    def test_validate_invalid_field(self, config_loader, invalid_config, field):
+        """Test that each invalid value is reported against its field."""
         result = config_loader.validate_config(invalid_config)
         
         assert not result.is_valid
-        assert any(err.field == "ADA.COUNTER_RANGE" for err in result.errors)
+        assert field in error_fields(result)
     
-    def test_validate_invalid_pdf_size(self, config_loader):
-        """Test validation with invalid PDF size."""
-        invalid_config = {
-            "PDF": {
-                "SIZE": "invalid_size"
-            }
-        }
-        result = config_loader.validate_config(invalid_config)
-        
-        assert not result.is_valid
-        assert any(err.field == "PDF.SIZE" for err in result.errors)
-    
-    def test_config_hash_consistency(self, config_loader, sample_config_dict):
+    def test_config_hash_consistency(self, config_loader, sample_config_dict, sample_config_hash):
         """Test that config hash is consistent for same data."""
-        hash1 = config_loader.get_config_hash(sample_config_dict)
-        hash2 = config_loader.get_config_hash(sample_config_dict)
-        
-        assert hash1 == hash2
-        assert len(hash1) == 64  # SHA256 hex digest length
+        assert config_loader.get_config_hash(sample_config_dict) == sample_config_hash
+        assert len(sample_config_hash) == 64  # SHA256 hex digest length
     
-    def test_config_hash_different_for_different_data(self, config_loader, sample_config_dict):
+    def test_config_hash_different_for_different_data(self, sample_config_hash, modified_config_hash):
         """Test that different configs produce different hashes."""
-        modified_config = sample_config_dict.copy()
-        modified_config["SCALE_PLAN"] = 0.5
-        
-        hash1 = config_loader.get_config_hash(sample_config_dict)
-        hash2 = config_loader.get_config_hash(modified_config)
-        
-        assert hash1 != hash2
+        assert modified_config_hash != sample_config_hash
     
-    def test_load_empty_yaml_file(self, config_loader):
+    def test_load_empty_yaml_file(self, config_loader, tmp_path):
         """Test loading YAML file that contains None."""
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write("# Empty file with just comments\n")
-            empty_file = Path(f.name)
+        empty_file = tmp_path / "empty.yaml"
+        empty_file.write_bytes(b"# Empty file with just comments\n")
         
-        try:
-            config_dict = config_loader.load_config(str(empty_file))
-            # Should load defaults when file is empty
-            assert isinstance(config_dict, dict)
-        finally:
-            empty_file.unlink()
+        config_dict = config_loader.load_config(str(empty_file))
+        # Should load defaults when file is empty
+        assert isinstance(config_dict, dict)
     
-    def test_validate_config_multiple_errors(self, config_loader):
+    def test_validate_config_multiple_errors(self, config_loader, tmp_path):
         """Test validation with multiple errors to trigger error message joining."""
         invalid_config = {
             "SCALE_PLAN": -1.0,  # Invalid: negative
@@ -175,160 +172,11 @@ class TestConfigLoader:
         }
         
         # Create a temporary file with invalid config to test the error path
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(invalid_config, f)
-            invalid_file = Path(f.name)
-        
-        try:
-            with pytest.raises(ValueError, match="Configuration validation failed"):
-                config_loader.load_config(str(invalid_file))
-        finally:
-            invalid_file.unlink()
-    
-    def test_validate_counter_height_invalid(self, config_loader):
-        """Test validation of COUNTER_HEIGHT with invalid values."""
-        # Test negative value
-        result = config_loader.validate_config({"COUNTER_HEIGHT": -10.0})
-        assert not result.is_valid
-        assert any(err.field == "COUNTER_HEIGHT" for err in result.errors)
-        
-        # Test non-numeric value
-        result = config_loader.validate_config({"COUNTER_HEIGHT": "not_a_number"})
-        assert not result.is_valid
-        assert any(err.field == "COUNTER_HEIGHT" for err in result.errors)
-    
-    def test_validate_base_depth_invalid(self, config_loader):
-        """Test validation of BASE_DEPTH with invalid values."""
-        # Test negative value
-        result = config_loader.validate_config({"BASE_DEPTH": -5.0})
-        assert not result.is_valid
-        assert any(err.field == "BASE_DEPTH" for err in result.errors)
-        
-        # Test non-numeric value
-        result = config_loader.validate_config({"BASE_DEPTH": "invalid"})
-        assert not result.is_valid
-        assert any(err.field == "BASE_DEPTH" for err in result.errors)
-    
-    def test_validate_wall_cab_depth_invalid(self, config_loader):
-        """Test validation of WALL_CAB_DEPTH with invalid values."""
-        # Test negative value
-        result = config_loader.validate_config({"WALL_CAB_DEPTH": 0})
-        assert not result.is_valid
-        assert any(err.field == "WALL_CAB_DEPTH" for err in result.errors)
+        invalid_file = tmp_path / "invalid.yaml"
+        invalid_file.write_bytes(yaml.dump(invalid_config, Dumper=CDumper, encoding="utf-8"))
         
-        # Test non-numeric value
-        result = config_loader.validate_config({"WALL_CAB_DEPTH": "invalid"})
-        assert not result.is_valid
-        assert any(err.field == "WALL_CAB_DEPTH" for err in result.errors)
-    
-    def test_validate_ada_counter_range_edge_cases(self, config_loader):
-        """Test ADA COUNTER_RANGE validation edge cases."""
-        # Test not a list
-        invalid_config = {
-            "ADA": {
-                "COUNTER_RANGE": "not_a_list"
-            }
-        }
-        result = config_loader.validate_config(invalid_config)
-        assert not result.is_valid
-        assert any(err.field == "ADA.COUNTER_RANGE" for err in result.errors)
-        
-        # Test wrong length (not 2 elements)
-        invalid_config = {
-            "ADA": {
-                "COUNTER_RANGE": [28.0, 34.0, 36.0]  # 3 elements instead of 2
-            }
-        }
-        result = config_loader.validate_config(invalid_config)
-        assert not result.is_valid
-        assert any(err.field == "ADA.COUNTER_RANGE" for err in result.errors)
-        
-        # Test non-numeric values in range
-        invalid_config = {
-            "ADA": {
-                "COUNTER_RANGE": ["28.0", 34.0]  # String instead of number
-            }
-        }
-        result = config_loader.validate_config(invalid_config)
-        assert not result.is_valid
-        assert any(err.field == "ADA.COUNTER_RANGE" for err in result.errors)
-        
-        # Test wrong order (first >= second)
-        invalid_config = {
-            "ADA": {
-                "COUNTER_RANGE": [35.0, 30.0]
-            }
-        }
-        result = config_loader.validate_config(invalid_config)
-        assert not result.is_valid
-        assert any(err.field == "ADA.COUNTER_RANGE" for err in result.errors)
-    
-    def test_validate_pdf_margins_invalid(self, config_loader):
-        """Test PDF MARGINS validation with invalid values."""
-        # Test wrong structure (not 4 values)
-        invalid_config = {
-            "PDF": {
-                "MARGINS": [0.5, 0.5]  # Only 2 values instead of 4
-            }
-        }
-        result = config_loader.validate_config(invalid_config)
-        assert not result.is_valid
-        assert any(err.field == "PDF.MARGINS" for err in result.errors)
-        
-        # Test negative values
-        invalid_config = {
-            "PDF": {
-                "MARGINS": [0.5, -0.5, 0.5, 0.5]  # Negative margin
-            }
-        }
-        result = config_loader.validate_config(invalid_config)
-        assert not result.is_valid
-        assert any(err.field == "PDF.MARGINS" for err in result.errors)
-    
-    def test_validate_tolerances_invalid(self, config_loader):
-        """Test TOLERANCES validation with invalid values."""
-        # Test LENGTH_SUM invalid
-        result = config_loader.validate_config({
-            "TOLERANCES": {
-                "LENGTH_SUM": -0.5  # Negative value
-            }
-        })
-        assert not result.is_valid
-        assert any(err.field == "TOLERANCES.LENGTH_SUM" for err in result.errors)
-        
-        # Test LENGTH_ROUNDING invalid
-        result = config_loader.validate_config({
-            "TOLERANCES": {
-                "LENGTH_ROUNDING": -1  # Negative integer
-            }
-        })
-        assert not result.is_valid
-        assert any(err.field == "TOLERANCES.LENGTH_ROUNDING" for err in result.errors)
-        
-        # Test non-integer LENGTH_ROUNDING
-        result = config_loader.validate_config({
-            "TOLERANCES": {
-                "LENGTH_ROUNDING": 2.5  # Float instead of int
-            }
-        })
-        assert not result.is_valid
-        assert any(err.field == "TOLERANCES.LENGTH_ROUNDING" for err in result.errors)
-    
-    def test_validate_edge_rules_invalid(self, config_loader):
-        """Test EDGE_RULES validation with invalid values."""
-        # Test non-list value
-        result = config_loader.validate_config({
-            "EDGE_RULES": "not_a_list"
-        })
-        assert not result.is_valid
-        assert any(err.field == "EDGE_RULES" for err in result.errors)
-        
-        # Test list with non-string values
-        result = config_loader.validate_config({
-            "EDGE_RULES": ["MATCH_FACE", 123, "EDGE_BAND"]  # Number in list
-        })
-        assert not result.is_valid
-        assert any(err.field == "EDGE_RULES" for err in result.errors)
+        with pytest.raises(ValueError, match="Configuration validation failed"):
+            config_loader.load_config(str(invalid_file))
 
 
 class TestConfigIntegration:
@@ -343,55 +191,40 @@ class TestConfigIntegration:
         assert config.counter_height > 0
         assert len(config.ada.counter_range) == 2
     
-    def test_full_config_pipeline(self, sample_config_dict):
+    def test_full_config_pipeline(self, temp_config_file):
         """Test the complete configuration pipeline."""
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            yaml.dump(sample_config_dict, f)
-            config_file = Path(f.name)
+        # Load and validate the sample config written by the fixture
+        loader = ConfigLoader()
+        config_dict = loader.load_config(str(temp_config_file))
+        config_hash = loader.get_config_hash(config_dict)
         
-        try:
-            # Load and validate
-            loader = ConfigLoader()
-            config_dict = loader.load_config(str(config_file))
-            config_hash = loader.get_config_hash(config_dict)
-            
-            # Verify loaded correctly
-            assert config_dict["SCALE_PLAN"] == 0.25
-            assert isinstance(config_hash, str)
-            assert len(config_hash) == 64
-            
-            # Create typed config
-            typed_config = MillworkConfig.from_dict(config_dict)
-            assert typed_config.scale_plan == 0.25
-            assert typed_config.ada.counter_range == [28.0, 34.0]
-            
-        finally:
-            config_file.unlink()  # Clean up
+        # Verify loaded correctly
+        assert config_dict["SCALE_PLAN"] == 0.25
+        assert isinstance(config_hash, str)
+        assert len(config_hash) == 64
+        
+        # Create typed config
+        typed_config = MillworkConfig.from_dict(config_dict)
+        assert typed_config.scale_plan == 0.25
+        assert typed_config.ada.counter_range == [28.0, 34.0]
     
-    def test_save_config_to_yaml(self, sample_millwork_config):
+    def test_save_config_to_yaml(self, sample_millwork_config, tmp_path):
         """Test saving configuration to YAML file."""
         from src.core.config import save_config_to_yaml
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            output_file = Path(f.name)
+        output_file = tmp_path / "saved_config.yaml"
+        
+        # Save config to file
+        save_config_to_yaml(sample_millwork_config, str(output_file))
+        
+        # Verify file was created and contains valid YAML
+        assert output_file.exists()
+        
+        with open(output_file, 'r', encoding='utf-8') as f:
+            loaded_data = yaml.load(f, Loader=CLoader)
         
-        try:
-            # Save config to file
-            save_config_to_yaml(sample_millwork_config, str(output_file))
-            
-            # Verify file was created and contains valid YAML
-            assert output_file.exists()
-            
-            with open(output_file, 'r', encoding='utf-8') as f:
-                loaded_data = yaml.safe_load(f)
-            
-            # Verify the data is correct
-            assert loaded_data["SCALE_PLAN"] == sample_millwork_config.scale_plan
-            assert loaded_data["COUNTER_HEIGHT"] == sample_millwork_config.counter_height
-            assert "ADA" in loaded_data
-            assert "PDF" in loaded_data
-            
-        finally:
-            if output_file.exists():
-                output_file.unlink()
\ No newline at end of file
+        # Verify the data is correct
+        assert loaded_data["SCALE_PLAN"] == sample_millwork_config.scale_plan
+        assert loaded_data["COUNTER_HEIGHT"] == sample_millwork_config.counter_height
+        assert "ADA" in loaded_data
+        assert "PDF" in loaded_data
\ No newline at end of file
@@ -6,9 +6,9 @@ and integration with schema as specified in tech_specs.md section 8.
 """
 
 import pytest
-import tempfile
 import json
 from pathlib import Path
+from unittest.mock import patch
 from src.parser.csv_parser import CSVParser, FieldParser, ParsedValue
 from src.parser.schema import FieldDefinition, FieldType, RoomSchema
 from src.core.interfaces import ValidationResult
@@ -56,6 +56,27 @@ class TestFieldParser:
         result = FieldParser.parse_string("ABC123", field_def)
         assert not result.is_valid
         assert "does not match pattern" in result.error_message
+        
+        # '$' alone would accept a trailing newline
+        result = FieldParser.parse_string("ABCDEF\n", field_def)
+        assert not result.is_valid
+        assert "does not match pattern" in result.error_message
+    
+    def test_parse_string_enum(self):
+        """Test parsing string values restricted to an enum."""
+        field_def = FieldDefinition(
+            name="test_enum",
+            field_type=FieldType.STRING,
+            enum_values=["MATCH_FACE", "PVC_EDGE"]
+        )
+        
+        result = FieldParser.parse_string("PVC_EDGE", field_def)
+        assert result.is_valid
+        assert result.value == "PVC_EDGE"
+        
+        result = FieldParser.parse_string("RADIUS", field_def)
+        assert not result.is_valid
+        assert "Value not in allowed set: ['MATCH_FACE', 'PVC_EDGE']" in result.error_message
     
     def test_parse_number_valid(self):
         """Test parsing valid number values."""
@@ -97,6 +118,12 @@ class TestFieldParser:
         result = FieldParser.parse_number("not_a_number", field_def)
         assert not result.is_valid
         assert "Invalid number format" in result.error_message
+        
+        # Non-finite values are rejected even though float() accepts them
+        for value in ["nan", "inf", "-Infinity"]:
+            result = FieldParser.parse_number(value, field_def)
+            assert not result.is_valid
+            assert "Invalid number format" in result.error_message
     
     def test_parse_integer_valid(self):
         """Test parsing valid integer values."""
@@ -129,6 +156,11 @@ class TestFieldParser:
         result = FieldParser.parse_integer("15", field_def)
         assert not result.is_valid
         assert "Value too large" in result.error_message
+        
+        # Invalid format
+        result = FieldParser.parse_integer("five", field_def)
+        assert not result.is_valid
+        assert "Invalid integer format" in result.error_message
     
     def test_parse_boolean_valid(self):
         """Test parsing valid boolean values."""
@@ -201,17 +233,26 @@ class TestFieldParser:
         result = FieldParser.parse_string_list("[36, 'abc']", field_def)
         assert not result.is_valid
         assert "Invalid JSON array format" in result.error_message
+        
+        # Non-finite constants are not valid JSON numbers
+        result = FieldParser.parse_string_list("[36, NaN]", field_def)
+        assert not result.is_valid
+        assert "Invalid JSON array format" in result.error_message
 
 
 class TestCSVParser:
     """Test CSVParser class."""
     
+    @pytest.fixture(autouse=True)
+    def _use_tmp_path(self, tmp_path):
+        """Give each test its own pytest-managed temporary directory."""
+        self.tmp_path = tmp_path
+    
     def create_temp_csv(self, content: str) -> Path:
         """Create temporary CSV file for testing."""
-        temp_file = tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False)
-        temp_file.write(content)
-        temp_file.close()
-        return Path(temp_file.name)
+        csv_file = self.tmp_path / "rooms.csv"
+        csv_file.write_text(content)
+        return csv_file
     
     def test_parse_valid_csv(self):
         """Test parsing a valid CSV file."""
@@ -219,69 +260,79 @@ class TestCSVParser:
 KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT
 BATH-01,72.0,2,"[36,36]",LAM-01,PLM-WHT"""
         
-        csv_file = self.create_temp_csv(csv_content)
-        try:
-            parser = CSVParser()
-            parsed_data, validation_result = parser.parse_file(csv_file)
-            
-            assert validation_result.is_valid
-            assert len(parsed_data) == 2
-            
-            # Check first room
-            room1 = parsed_data[0]
-            assert room1.room_id == "KITCHEN-01"
-            assert room1.total_length_in == 144.0
-            assert room1.num_modules == 4
-            assert room1.module_widths == [36.0, 30.0, 36.0, 42.0]
-            assert room1.material_top == "QTZ-01"
-            assert room1.material_casework == "PLM-WHT"
-            
-            # Check second room
-            room2 = parsed_data[1]
-            assert room2.room_id == "BATH-01"
-            assert room2.total_length_in == 72.0
-            assert room2.num_modules == 2
-            assert room2.module_widths == [36.0, 36.0]
-            
-        finally:
-            csv_file.unlink()  # Clean up
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        assert validation_result.is_valid
+        assert len(parsed_data) == 2
+        
+        # Check first room
+        room1 = parsed_data[0]
+        assert room1.room_id == "KITCHEN-01"
+        assert room1.total_length_in == 144.0
+        assert room1.num_modules == 4
+        assert room1.module_widths == [36.0, 30.0, 36.0, 42.0]
+        assert room1.material_top == "QTZ-01"
+        assert room1.material_casework == "PLM-WHT"
+        
+        # Check second room
+        room2 = parsed_data[1]
+        assert room2.room_id == "BATH-01"
+        assert room2.total_length_in == 72.0
+        assert room2.num_modules == 2
+        assert room2.module_widths == [36.0, 36.0]
     
     def test_parse_csv_with_optional_fields(self):
         """Test parsing CSV with optional fields."""
         csv_content = """room_id,total_length_in,num_modules,module_widths,material_top,material_casework,has_sink,counter_height_in
 KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT,true,36.0"""
         
-        csv_file = self.create_temp_csv(csv_content)
-        try:
-            parser = CSVParser()
-            parsed_data, validation_result = parser.parse_file(csv_file)
-            
-            assert validation_result.is_valid
-            assert len(parsed_data) == 1
-            
-            room = parsed_data[0]
-            assert room.has_sink is True
-            assert room.counter_height_in == 36.0
-            
-        finally:
-            csv_file.unlink()
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        assert validation_result.is_valid
+        assert len(parsed_data) == 1
+        
+        room = parsed_data[0]
+        assert room.has_sink is True
+        assert room.counter_height_in == 36.0
     
     def test_parse_csv_missing_required_field(self):
         """Test parsing CSV with missing required field."""
         csv_content = """room_id,total_length_in,num_modules,material_top,material_casework
 KITCHEN-01,144.0,4,QTZ-01,PLM-WHT"""
         
-        csv_file = self.create_temp_csv(csv_content)
-        try:
-            parser = CSVParser()
-            parsed_data, validation_result = parser.parse_file(csv_file)
-            
-            assert not validation_result.is_valid
-            assert len(validation_result.errors) > 0
-            assert any("Missing required fields" in error.message for error in validation_result.errors)
-            
-        finally:
-            csv_file.unlink()
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        assert not validation_result.is_valid
+        assert len(validation_result.errors) > 0
+        assert any("Missing required fields" in error.message for error in validation_result.errors)
+    
+    def test_parse_csv_missing_required_field_skips_rows(self):
+        """Test that a rejected header stops parsing before any data row."""
+        csv_content = """room_id,total_length_in,num_modules,material_top,material_casework
+KITCHEN-01,not_a_number,4,QTZ-01,PLM-WHT
+BATH-01,72.0,not_an_integer,LAM-01,PLM-WHT"""
+        
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        assert parsed_data == []
+        assert [error.field for error in validation_result.errors] == ["headers"]
+    
+    def test_parse_csv_empty_file_reports_missing_headers(self):
+        """Test that an empty file reports missing headers on both parse paths."""
+        csv_file = self.create_temp_csv("")
+        serial_data, serial_result = CSVParser().parse_file(csv_file)
+        
+        parser = CSVParser(max_workers=2)
+        parser.PARALLEL_THRESHOLD_BYTES = 0
+        parallel_data, parallel_result = parser.parse_file(csv_file)
+        
+        for parsed_data, validation_result in ((serial_data, serial_result), (parallel_data, parallel_result)):
+            assert parsed_data == []
+            assert [error.message for error in validation_result.errors] == ["No headers found in CSV file"]
     
     def test_parse_csv_invalid_data_types(self):
         """Test parsing CSV with invalid data types."""
@@ -289,21 +340,16 @@ KITCHEN-01,144.0,4,QTZ-01,PLM-WHT"""
 KITCHEN-01,not_a_number,4,"[36,30,36,42]",QTZ-01,PLM-WHT
 BATH-01,72.0,not_an_integer,"[36,36]",LAM-01,PLM-WHT"""
         
-        csv_file = self.create_temp_csv(csv_content)
-        try:
-            parser = CSVParser()
-            parsed_data, validation_result = parser.parse_file(csv_file)
-            
-            assert not validation_result.is_valid
-            assert len(validation_result.errors) > 0
-            
-            # Check that specific errors are reported
-            error_messages = [error.message for error in validation_result.errors]
-            assert any("Invalid number format" in msg for msg in error_messages)
-            assert any("Invalid integer format" in msg for msg in error_messages)
-            
-        finally:
-            csv_file.unlink()
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        assert not validation_result.is_valid
+        assert len(validation_result.errors) > 0
+        
+        # Check that specific errors are reported
+        error_messages = [error.message for error in validation_result.errors]
+        assert any("Invalid number format" in msg for msg in error_messages)
+        assert any("Invalid integer format" in msg for msg in error_messages)
     
     def test_parse_csv_duplicate_room_ids(self):
         """Test parsing CSV with duplicate room IDs."""
@@ -311,37 +357,115 @@ BATH-01,72.0,not_an_integer,"[36,36]",LAM-01,PLM-WHT"""
 KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT
 KITCHEN-01,72.0,2,"[36,36]",LAM-01,PLM-WHT"""
         
-        csv_file = self.create_temp_csv(csv_content)
-        try:
-            parser = CSVParser()
-            parsed_data, validation_result = parser.parse_file(csv_file)
-            
-            # First room should parse successfully, second should fail due to duplicate ID
-            assert not validation_result.is_valid
-            assert len(parsed_data) == 1  # Only first room is valid
-            assert any("Duplicate room_id" in error.message for error in validation_result.errors)
-            
-        finally:
-            csv_file.unlink()
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        # First room should parse successfully, second should fail due to duplicate ID
+        assert not validation_result.is_valid
+        assert len(parsed_data) == 1  # Only first room is valid
+        assert any("Duplicate room_id" in error.message for error in validation_result.errors)
     
     def test_parse_csv_unknown_fields(self):
         """Test parsing CSV with unknown fields (should warn, not error)."""
         csv_content = """room_id,total_length_in,num_modules,module_widths,material_top,material_casework,unknown_field
 KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT,some_value"""
         
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        # Should succeed with warning
+        assert validation_result.is_valid  # Warnings don't make it invalid
+        assert len(validation_result.warnings) > 0
+        assert any("Unknown fields will be ignored" in warning.message for warning in validation_result.warnings)
+        assert len(parsed_data) == 1
+    
+    def test_parse_csv_shares_repeated_material_codes(self):
+        """Test that repeated material codes are interned across rows."""
+        csv_content = """room_id,total_length_in,num_modules,module_widths,material_top,material_casework
+KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT
+BATH-01,72.0,2,"[36,36]",QTZ-01,PLM-WHT"""
+        
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        assert validation_result.is_valid
+        assert parsed_data[0].material_top is parsed_data[1].material_top
+        assert parsed_data[0].material_casework is parsed_data[1].material_casework
+    
+    def test_parse_csv_cell_cache_is_per_parse(self):
+        """Test that memoized cells are shared within one parse but not across parses."""
+        csv_content = """room_id,total_length_in,num_modules,module_widths,material_top,material_casework
+KITCHEN-01,72.0,2,"[36,36]",QTZ-01,PLM-WHT
+KITCHEN-02,72.0,2,"[36,36]",QTZ-01,PLM-WHT"""
+        
+        parser = CSVParser()
+        first, _ = parser.parse_text(csv_content)
+        second, _ = parser.parse_text(csv_content)
+        
+        assert first[0].total_length_in is first[1].total_length_in
+        assert second[0].total_length_in is not first[0].total_length_in
+    
+    def test_parse_csv_repeated_cells_do_not_share_lists(self):
+        """Test that cached cell parses never hand two rooms the same list."""
+        csv_content = """room_id,total_length_in,num_modules,module_widths,material_top,material_casework
+KITCHEN-01,72.0,2,"[36,36]",QTZ-01,PLM-WHT
+KITCHEN-02,72.0,2,"[36,36]",QTZ-01,PLM-WHT
+KITCHEN-03,72.0,two,"[36,36]",QTZ-01,PLM-WHT"""
+        
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        assert [room.total_length_in for room in parsed_data] == [72.0, 72.0]
+        assert parsed_data[0].module_widths == parsed_data[1].module_widths
+        assert parsed_data[0].module_widths is not parsed_data[1].module_widths
+        assert [error.row_number for error in validation_result.errors] == [4]
+    
+    def test_parse_text_matches_parse_file(self):
+        """Test that parsing in-memory content matches parsing the same file."""
+        csv_content = """room_id,total_length_in,num_modules,module_widths,material_top,material_casework
+KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT
+BATH-01,not_a_number,2,"[36,36]",LAM-01,PLM-WHT"""
+        
         csv_file = self.create_temp_csv(csv_content)
-        try:
-            parser = CSVParser()
-            parsed_data, validation_result = parser.parse_file(csv_file)
-            
-            # Should succeed with warning
-            assert validation_result.is_valid  # Warnings don't make it invalid
-            assert len(validation_result.warnings) > 0
-            assert any("Unknown fields will be ignored" in warning.message for warning in validation_result.warnings)
-            assert len(parsed_data) == 1
-            
-        finally:
-            csv_file.unlink()
+        file_data, file_result = CSVParser().parse_file(csv_file)
+        text_data, text_result = CSVParser().parse_text(csv_content, source_file=str(csv_file))
+        
+        assert text_data == file_data
+        assert [(e.field, e.message, e.row_number) for e in text_result.errors] == \
+            [(e.field, e.message, e.row_number) for e in file_result.errors]
+    
+    def test_parse_csv_keeps_newlines_in_quoted_fields(self):
+        """Test that CRLF files keep line breaks inside quoted cells intact."""
+        csv_file = self.tmp_path / "rooms.csv"
+        csv_file.write_bytes(
+            b'room_id,total_length_in,num_modules,module_widths,material_top,material_casework,notes\r\n'
+            b'KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT,"Line 1\r\nLine 2"\r\n'
+        )
+        
+        parsed_data, validation_result = CSVParser().parse_file(csv_file)
+        
+        assert validation_result.is_valid
+        assert parsed_data[0].notes == "Line 1\r\nLine 2"
+    
+    def test_parse_csv_in_parallel_keeps_newlines_in_quoted_fields(self):
+        """Test that byte ranges are never cut inside a multi-line quoted cell."""
+        row = 'ROOM-{0:02d},144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT,"Line 1\r\nLine ""2""\r\nLine 3"\r\n'
+        csv_file = self.tmp_path / "rooms.csv"
+        csv_file.write_bytes(
+            b'room_id,total_length_in,num_modules,module_widths,material_top,material_casework,notes\r\n'
+            + "".join(row.format(i) for i in range(7)).encode()
+        )
+        serial_data, serial_result = CSVParser().parse_file(csv_file)
+        
+        parser = CSVParser(max_workers=9)
+        parser.PARALLEL_THRESHOLD_BYTES = 0
+        parallel_data, parallel_result = parser.parse_file(csv_file)
+        
+        assert serial_result.is_valid
+        assert parallel_result.is_valid
+        assert parallel_data == serial_data
+        assert [room.row_number for room in parallel_data] == list(range(2, 9))
+        assert parallel_data[-1].notes == 'Line 1\r\nLine "2"\r\nLine 3'
     
     def test_parse_nonexistent_file(self):
         """Test parsing a nonexistent file."""
@@ -357,17 +481,99 @@ KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT,some_value"""
         csv_content = """room_id\ttotal_length_in\tnum_modules\tmodule_widths\tmaterial_top\tmaterial_casework
 KITCHEN-01\t144.0\t4\t[36,30,36,42]\tQTZ-01\tPLM-WHT"""
         
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        assert validation_result.is_valid
+        assert len(parsed_data) == 1
+        
+        room = parsed_data[0]
+        assert room.room_id == "KITCHEN-01"
+        assert room.total_length_in == 144.0
+    
+    def test_parse_tab_delimited_csv_with_long_lists(self):
+        """Test that commas inside list cells don't outvote the header's tabs."""
+        header = "room_id\ttotal_length_in\tnum_modules\tmodule_widths\tmaterial_top\tmaterial_casework"
+        row = "ROOM-{0:02d}\t144.0\t12\t[12,12,12,12,12,12,12,12,12,12,12,12]\tQTZ-01\tPLM-WHT"
+        csv_content = "\n".join([header] + [row.format(i) for i in range(10)])
+        
+        parser = CSVParser()
+        parsed_data, validation_result = parser.parse_text(csv_content)
+        
+        assert validation_result.is_valid
+        assert len(parsed_data) == 10
+        assert parsed_data[0].module_widths == [12.0] * 12
+    
+    def test_parse_csv_in_parallel_matches_serial(self):
+        """Test that parsing byte ranges in worker processes matches serial parsing."""
+        csv_content = """room_id,total_length_in,num_modules,module_widths,material_top,material_casework
+KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT
+BATH-01,72.0,2,"[36,36]",LAM-01,PLM-WHT
+OFFICE-01,not_a_number,3,"[24,48,24]",LAM-02,OAK-NAT
+KITCHEN-01,72.0,2,"[36,36]",LAM-01,PLM-WHT
+LAUNDRY-01,60.0,2,"[30,30]",LAM-01,PLM-WHT"""
+        
         csv_file = self.create_temp_csv(csv_content)
-        try:
-            parser = CSVParser()
+        serial_data, serial_result = CSVParser().parse_file(csv_file)
+        
+        parser = CSVParser(max_workers=3)
+        parser.PARALLEL_THRESHOLD_BYTES = 0
+        parallel_data, parallel_result = parser.parse_file(csv_file)
+        
+        assert parallel_data == serial_data
+        assert [room.row_number for room in parallel_data] == [2, 3, 6]
+        assert [(e.field, e.message, e.row_number) for e in parallel_result.errors] == \
+            [(e.field, e.message, e.row_number) for e in serial_result.errors]
+    
+    def test_parse_csv_single_worker_stays_serial(self):
+        """Test that a single worker streams the file instead of starting a pool."""
+        csv_content = """room_id,total_length_in,num_modules,module_widths,material_top,material_casework
+KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT
+BATH-01,not_a_number,2,"[36,36]",LAM-01,PLM-WHT"""
+        
+        csv_file = self.create_temp_csv(csv_content)
+        parser = CSVParser(max_workers=1)
+        parser.PARALLEL_THRESHOLD_BYTES = 0
+        with patch("src.parser.csv_parser.ProcessPoolExecutor") as pool:
             parsed_data, validation_result = parser.parse_file(csv_file)
-            
-            assert validation_result.is_valid
-            assert len(parsed_data) == 1
-            
-            room = parsed_data[0]
-            assert room.room_id == "KITCHEN-01"
-            assert room.total_length_in == 144.0
-            
-        finally:
-            csv_file.unlink()
\ No newline at end of file
+        
+        pool.assert_not_called()
+        assert [room.room_id for room in parsed_data] == ["KITCHEN-01"]
+        assert [error.row_number for error in validation_result.errors] == [3]
+    
+    def test_iter_rows_streams_valid_rooms(self):
+        """Test that iter_rows yields rooms one at a time with the shared result."""
+        csv_content = """room_id,total_length_in,num_modules,module_widths,material_top,material_casework
+KITCHEN-01,144.0,4,"[36,30,36,42]",QTZ-01,PLM-WHT
+BATH-01,not_a_number,2,"[36,36]",LAM-01,PLM-WHT
+OFFICE-01,96.0,3,"[24,48,24]",LAM-02,OAK-NAT"""
+        
+        csv_file = self.create_temp_csv(csv_content)
+        parser = CSVParser()
+        rows = parser.iter_rows(csv_file)
+        
+        room, result = next(rows)
+        assert room.room_id == "KITCHEN-01"
+        assert result.is_valid
+        
+        room, result = next(rows)
+        assert room.room_id == "OFFICE-01"
+        assert not result.is_valid
+        assert any("Invalid number format" in error.message for error in result.errors)
+        
+        assert next(rows, None) is None
+    
+    def test_parse_csv_reordered_columns_and_blank_lines(self):
+        """Test that columns are matched by header and blank lines are skipped."""
+        csv_content = """material_casework,room_id,num_modules,module_widths,material_top,total_length_in
+PLM-WHT,KITCHEN-01,4,"[36,30,36,42]",QTZ-01,144.0
+
+OAK-NAT,OFFICE-01,3,"[24,48,24]",LAM-02,96.0"""
+        
+        parser = CSVParser()
+        rooms, result = parser.parse_text(csv_content)
+        
+        assert result.is_valid
+        assert [room.room_id for room in rooms] == ["KITCHEN-01", "OFFICE-01"]
+        assert [room.row_number for room in rooms] == [2, 3]
+        assert rooms[1].total_length_in == 96.0
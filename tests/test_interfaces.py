@@ -4,6 +4,9 @@ Unit tests for core interfaces.
 Tests the abstract interfaces and data structures defined in the core module.
 """
 
+import dataclasses
+import pickle
+
 import pytest
 from src.core.interfaces import (
     Point, Rectangle, DrawingMetadata, ValidationResult, ValidationError,
@@ -29,6 +32,22 @@ class TestDataStructures:
         assert rect.width == 36
         assert rect.height == 24
     
+    def test_geometry_uses_slots(self):
+        """Test geometry dataclasses carry no per-instance __dict__."""
+        assert not hasattr(Point(x=1, y=2), "__dict__")
+        assert not hasattr(Rectangle(x=0, y=0, width=1, height=1), "__dict__")
+        assert Rectangle(x=0, y=0, width=1, height=1) == Rectangle(x=0, y=0, width=1, height=1)
+    
+    def test_geometry_is_immutable_and_hashable(self):
+        """Test geometry values can be shared and used as cache keys."""
+        rect = Rectangle(x=0, y=0, width=36, height=24)
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            rect.width = 30
+        
+        assert len({Point(x=1, y=2), Point(x=1, y=2), Point(x=2, y=1)}) == 2
+        assert hash(rect) == hash(Rectangle(x=0, y=0, width=36, height=24))
+        assert pickle.loads(pickle.dumps(rect)) == rect
+    
     def test_drawing_metadata_creation(self):
         """Test DrawingMetadata creation."""
         metadata = DrawingMetadata(
@@ -66,6 +85,19 @@ class TestValidationResult:
         assert result.errors[0].value == "invalid_value"
         assert result.errors[0].error_type == "error"
     
+    def test_add_errors(self):
+        """Test adding a batch of existing validation errors."""
+        result = ValidationResult(is_valid=True, errors=[], warnings=[])
+        result.add_errors([])
+        assert result.is_valid  # An empty batch changes nothing
+        
+        errors = [ValidationError("field1", "Error 1", "value1"),
+                  ValidationError("field2", "Error 2", "value2")]
+        result.add_errors(iter(errors))
+        
+        assert not result.is_valid
+        assert result.errors == errors
+    
     def test_add_warning(self):
         """Test adding validation warning."""
         result = ValidationResult(is_valid=True, errors=[], warnings=[])
@@ -123,6 +123,15 @@ class TestGeometryUtils:
         assert is_valid is True
         assert difference == 0.0
     
+    def test_validate_length_sum_is_exact(self, geometry_utils):
+        """Test length sum has no accumulated rounding at zero tolerance."""
+        is_valid, difference = geometry_utils.validate_length_sum(
+            [0.1] * 10, 0.0, 0.0, 1.0, tolerance=0.0
+        )
+        
+        assert is_valid is True
+        assert difference == 0.0
+    
     def test_validate_length_sum_outside_tolerance(self, geometry_utils):
         """Test length sum validation outside tolerance."""
         module_widths = [36.0, 30.0, 36.0, 42.0]  # Sum = 144
@@ -482,6 +491,22 @@ class TestParametricLayoutEngine:
         assert result.metadata.computation_time_ms is not None
         assert result.metadata.computation_time_ms > 0
         assert result.metadata.tolerance_used == 0.125
+    
+    def test_config_hash_follows_config(self, layout_engine, config, sample_room_data):
+        """Test the cached config hash is reused per config and refreshed on change."""
+        first = layout_engine.compute_layout(sample_room_data, config)
+        again = layout_engine.compute_layout(sample_room_data, config)
+        assert again.metadata.config_sha256 == first.metadata.config_sha256
+        
+        other_config = {**config, "SCALE_PLAN": 0.5}
+        other = layout_engine.compute_layout(sample_room_data, other_config)
+        assert other.metadata.config_sha256 != first.metadata.config_sha256
+        
+        # Editing the same dict in place must not reuse the stale digest
+        other_config["SCALE_PLAN"] = 0.125
+        edited = layout_engine.compute_layout(sample_room_data, other_config)
+        assert edited.metadata.config_sha256 not in (first.metadata.config_sha256,
+                                                     other.metadata.config_sha256)
 
 
 class TestLayoutIntegration:
@@ -10,6 +10,7 @@ from pathlib import Path
 import tempfile
 import os
 from datetime import datetime
+from unittest.mock import patch
 
 from src.core.interfaces import (
     IRenderer, RenderStyle, Point, DrawingMetadata, Rectangle, 
@@ -101,6 +102,11 @@ class TestPDFRenderer:
         # Test text drawing
         self.renderer.draw_text(5, 5, "Test Text", RenderStyle.TEXT_MEDIUM)
         
+        # Test grouped text drawing, plain and rotated
+        labels = [(1, 1, "A"), (2, 2, "B")]
+        self.renderer.draw_texts(labels, RenderStyle.TEXT_SMALL)
+        self.renderer.draw_texts(labels, RenderStyle.TEXT_SMALL, rotation=90.0)
+        
         # Test dimension drawing
         self.renderer.draw_dimension(0, 10, 0, "10\"")
         
@@ -175,6 +181,39 @@ class TestShopDrawingGenerator:
         # Verify file has content
         assert os.path.getsize(pdf_path) > 1000  # Should be more than 1KB
     
+    def test_generate_batch_in_parallel_matches_serial(self):
+        """Test that worker-process batches return the serial results in order."""
+        first = self._create_test_layout()
+        second = self._create_test_layout()
+        second.room_id = "TEST-02"
+        layouts = [first, second]
+        
+        serial_dir = Path(self.temp_dir) / "serial"
+        parallel_dir = Path(self.temp_dir) / "parallel"
+        serial = self.generator.generate_batch(layouts, serial_dir)
+        
+        parallel_generator = ShopDrawingGenerator(self.renderer, self.config, max_workers=2)
+        parallel_generator.PARALLEL_THRESHOLD_LAYOUTS = 1
+        parallel = parallel_generator.generate_batch(layouts, parallel_dir)
+        
+        assert [room_id for room_id, _, _ in parallel] == ["TEST-01", "TEST-02"]
+        assert [error for _, _, error in parallel] == [None, None]
+        assert [Path(path).name for _, path, _ in parallel] == [Path(path).name for _, path, _ in serial]
+        assert all(Path(path).exists() for _, path, _ in parallel)
+    
+    def test_generate_batch_single_worker_stays_serial(self):
+        """Test that a single worker renders in-process with the given timestamp."""
+        layouts = [self._create_test_layout()]
+        generator = ShopDrawingGenerator(self.renderer, self.config, max_workers=1,
+                                         timestamp="2024-01-01T00:00:00")
+        generator.PARALLEL_THRESHOLD_LAYOUTS = 0
+        with patch("src.renderer.drawing_generator.ProcessPoolExecutor") as pool:
+            results = generator.generate_batch(layouts, Path(self.temp_dir))
+        
+        pool.assert_not_called()
+        assert [error for _, _, error in results] == [None]
+        assert generator._create_drawing_metadata(layouts[0]).timestamp == "2024-01-01T00:00:00"
+    
     def _create_test_layout(self) -> LayoutResult:
         """Create a test layout for testing."""
         modules = [
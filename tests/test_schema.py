@@ -48,6 +48,26 @@ class TestFieldDefinition:
                 field_type=FieldType.NUMBER,
                 min_length=5
             )
+        
+        for pattern in (r'^(A+)+$', r'^((A+))+$', r'^(A+|B)+$', r'^((A+)?)*$'):
+            with pytest.raises(ValueError, match="nests unbounded quantifiers"):
+                FieldDefinition(
+                    name="invalid_field",
+                    field_type=FieldType.STRING,
+                    pattern=pattern
+                )
+        
+        # A repeated group ending in a literal cannot backtrack exponentially
+        list_field = FieldDefinition(
+            name="list_field",
+            field_type=FieldType.STRING,
+            pattern=r'^(\d+,)*\d+$'
+        )
+        assert list_field._compiled_pattern.match("36,30,36")
+        
+        # Only the last atom of each alternative is checked (documented scope)
+        for pattern in (r'^(A|B)+$', r'^(\+)+$', r'^(A+B?)+$'):
+            FieldDefinition(name="list_field", field_type=FieldType.STRING, pattern=pattern)
 
 
 class TestRoomSchema:
@@ -92,6 +112,16 @@ class TestRoomSchema:
             assert field_def.name == field_name
             assert isinstance(field_def.field_type, FieldType)
     
+    def test_field_name_sets(self):
+        """Test precomputed field name sets match the field lists."""
+        assert RoomSchema.REQUIRED_FIELD_NAMES == set(RoomSchema.get_required_field_names())
+        assert RoomSchema.OPTIONAL_FIELD_NAMES == set(RoomSchema.get_optional_field_names())
+        assert RoomSchema.ALL_FIELD_NAMES == set(RoomSchema.get_all_fields())
+        
+        # Callers get their own copy of the field mapping
+        RoomSchema.get_all_fields().pop("room_id")
+        assert RoomSchema.get_field_definition("room_id") is not None
+    
     def test_field_validation(self):
         """Test field validation methods."""
         # Valid fields
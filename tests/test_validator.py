@@ -10,6 +10,7 @@ import pytest
 import tempfile
 import json
 from pathlib import Path
+from unittest.mock import patch
 from src.parser.validator import RoomValidator, ErrorReporter, BatchValidationSummary
 from src.parser.schema import ParsedRoomData
 from src.core.interfaces import ValidationResult
@@ -210,6 +211,51 @@ class TestRoomValidator:
         
         assert result.is_valid
         assert len(result.errors) == 0
+
+    def test_validate_room_data_leaves_room_unchanged(self, sample_room_data, sample_config):
+        """Test that validating a room reads its fields without altering them."""
+        validator = RoomValidator()
+        before = sample_room_data.to_dict()
+        assert vars(sample_room_data) == before
+
+        validator.validate_room_data(sample_room_data, sample_config)
+
+        assert sample_room_data.to_dict() == before
+
+    def test_compiled_config_follows_config_dict(self, sample_room_data, sample_config):
+        """Test that compiled constants are reused per dict and rebuilt for a new one."""
+        validator = RoomValidator()
+        data = sample_room_data.to_dict()
+        data["edge_rule"] = "CUSTOM_EDGE"
+
+        result = validator.validate_referential_integrity(data, sample_config)
+        assert not result.is_valid
+        assert "Valid options: ['MATCH_FACE', 'PVC_EDGE', 'SOLID_LUMBER']" in result.errors[0].message
+        assert validator._compile_config(sample_config) is validator._compile_config(sample_config)
+
+        other_config = dict(sample_config, EDGE_RULES=["CUSTOM_EDGE"])
+        result = validator.validate_referential_integrity(data, other_config)
+        assert result.is_valid
+
+    def test_compiled_config_follows_in_place_edits(self, sample_room_data, sample_config):
+        """Test that in-place config edits apply after invalidation and to every new batch."""
+        validator = RoomValidator()
+        sample_room_data.counter_height_in = 38.0  # Outside ADA range [28, 34]
+        sample_room_data.total_length_in = 150.0  # Module sum mismatch
+        
+        result = validator.validate_room_data(sample_room_data, sample_config)
+        assert any("outside ADA range" in warning.message for warning in result.warnings)
+        
+        sample_config["ADA"]["COUNTER_RANGE"] = [28, 40]
+        validator.invalidate_config()
+        result = validator.validate_room_data(sample_room_data, sample_config)
+        assert not any("outside ADA range" in warning.message for warning in result.warnings)
+        
+        _, summary = validator.validate_batch([sample_room_data], sample_config)
+        assert summary.failed_rows == 1
+        sample_config["TOLERANCES"]["LENGTH_SUM"] = 10.0
+        _, summary = validator.validate_batch([sample_room_data], sample_config)
+        assert summary.successful_rows == 1
     
     def test_validate_batch_all_valid(self, sample_config):
         """Test batch validation with all valid rooms."""
@@ -298,6 +344,49 @@ class TestRoomValidator:
         assert summary.total_rows == 2
         assert summary.successful_rows == 1
         assert summary.failed_rows == 1
+    
+    def test_validate_batch_in_parallel_matches_serial(self, sample_config):
+        """Test that validating a batch in worker processes matches serial validation."""
+        rooms = [
+            ParsedRoomData(room_id="KITCHEN-01", total_length_in=144.0, num_modules=4,
+                           module_widths=[36.0, 30.0, 36.0, 42.0],
+                           material_top="QTZ-01", material_casework="PLM-WHT"),
+            ParsedRoomData(room_id="INVALID-01", total_length_in=100.0, num_modules=2,
+                           module_widths=[36.0, 36.0],
+                           material_top="LAM-01", material_casework="PLM-WHT"),
+            ParsedRoomData(room_id="KITCHEN-01", total_length_in=72.0, num_modules=2,
+                           module_widths=[36.0, 36.0],
+                           material_top="LAM-01", material_casework="PLM-WHT"),
+            ParsedRoomData(room_id="BATH-01", total_length_in=72.0, num_modules=2,
+                           module_widths=[36.0, 36.0],
+                           material_top="LAM-01", material_casework="PLM-WHT"),
+        ]
+        
+        serial_rooms, serial_summary = RoomValidator().validate_batch(rooms, sample_config)
+        
+        validator = RoomValidator(max_workers=2)
+        validator.PARALLEL_THRESHOLD_ROOMS = 0
+        parallel_rooms, parallel_summary = validator.validate_batch(rooms, sample_config)
+        
+        assert [room.room_id for room in parallel_rooms] == ["KITCHEN-01", "BATH-01"]
+        assert parallel_rooms == serial_rooms
+        assert parallel_summary == serial_summary
+    
+    def test_validate_batch_single_worker_stays_serial(self, sample_config):
+        """Test that a single worker validates in-process instead of starting a pool."""
+        rooms = [
+            ParsedRoomData(room_id="KITCHEN-01", total_length_in=144.0, num_modules=4,
+                           module_widths=[36.0, 30.0, 36.0, 42.0],
+                           material_top="QTZ-01", material_casework="PLM-WHT"),
+        ]
+        validator = RoomValidator(max_workers=1)
+        validator.PARALLEL_THRESHOLD_ROOMS = 0
+        with patch("src.parser.validator.ProcessPoolExecutor") as pool:
+            valid_rooms, summary = validator.validate_batch(rooms, sample_config)
+        
+        pool.assert_not_called()
+        assert valid_rooms == rooms
+        assert summary.successful_rows == 1
 
 
 class TestErrorReporter:
@@ -378,6 +467,49 @@ class TestErrorReporter:
             error_file = output_dir / "logs" / "KITCHEN-01.errors.json"
             assert not error_file.exists()
 
+    def test_write_room_errors_batch(self):
+        """Test writing error reports for a batch of rooms."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            reporter = ErrorReporter(output_dir)
+
+            failed = ValidationResult(is_valid=True, errors=[], warnings=[])
+            failed.add_error("total_length_in", "Value too large", 1000.0, 2)
+            warned = ValidationResult(is_valid=True, errors=[], warnings=[])
+            warned.add_warning("counter_height_in", "Outside ADA range", 38.0, 3)
+            clean = ValidationResult(is_valid=True, errors=[], warnings=[])
+
+            reporter.write_room_errors_batch([
+                ("KITCHEN-01", failed), ("BATH-01", warned), ("OFFICE-01", clean)
+            ])
+
+            logs_dir = output_dir / "logs"
+            assert sorted(p.name for p in logs_dir.iterdir()) == [
+                "BATH-01.errors.json", "KITCHEN-01.errors.json"
+            ]
+            with open(logs_dir / "BATH-01.errors.json", 'r') as f:
+                assert json.load(f)["validation_status"] == "warning"
+
+    def test_write_room_errors_batch_merges_duplicate_room_ids(self):
+        """Test that results sharing a room_id are written as one combined report."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            output_dir = Path(temp_dir)
+            reporter = ErrorReporter(output_dir)
+
+            warned = ValidationResult(is_valid=True, errors=[], warnings=[])
+            warned.add_warning("counter_height_in", "Outside ADA range", 38.0, 2)
+            failed = ValidationResult(is_valid=True, errors=[], warnings=[])
+            failed.add_error("total_length_in", "Value too large", 1000.0, 3)
+
+            reporter.write_room_errors_batch([("KITCHEN-01", warned), ("KITCHEN-01", failed)])
+
+            with open(output_dir / "logs" / "KITCHEN-01.errors.json", 'r') as f:
+                report = json.load(f)
+            assert report["validation_status"] == "failed"
+            assert [error["field"] for error in report["errors"]] == ["total_length_in"]
+            assert [warning["field"] for warning in report["warnings"]] == ["counter_height_in"]
+            assert warned.is_valid and not warned.errors
+
 
 class TestBatchValidationSummary:
     """Test BatchValidationSummary class."""
@@ -405,4 +537,14 @@ class TestBatchValidationSummary:
         assert summary.successful_rows == 8
         assert summary.failed_rows == 2
         assert len(summary.validation_errors) == 2
-        assert len(summary.error_reasons) == 2
\ No newline at end of file
+        assert len(summary.error_reasons) == 2
+    
+    def test_record_error_caps_messages(self):
+        """Test that every error is counted but only the reported messages are kept."""
+        summary = BatchValidationSummary()
+        for i in range(BatchValidationSummary.MAX_VALIDATION_ERRORS + 10):
+            summary.record_error("total_length_in", f"ROOM-{i}: Value too large")
+        
+        assert summary.error_reasons == {"total_length_in": BatchValidationSummary.MAX_VALIDATION_ERRORS + 10}
+        assert len(summary.validation_errors) == BatchValidationSummary.MAX_VALIDATION_ERRORS
+        assert summary.validation_errors[0] == "ROOM-0: Value too large"